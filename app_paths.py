@@ -0,0 +1,66 @@
+# ============================================================================
+# FILE: app_paths.py
+# ============================================================================
+
+import os
+from typing import IO, Callable
+
+APP_DIR_NAME = "UnifiedControlPanel"
+
+
+def write_atomic(path: str, writer: Callable[[IO], None], binary: bool = False):
+    """Write a file through writer(f) so readers never see a partial file
+    
+    The data goes to a temporary file next to path, which then replaces
+    path. On OSError the temporary file is removed and the error re-raised.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, "wb" if binary else "w",
+                  encoding=None if binary else "utf-8") as f:
+            writer(f)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def get_app_dir() -> str:
+    """Directory containing the application sources"""
+    return os.path.dirname(os.path.abspath(__file__))
+
+
+def _posix_dir(variable: str, default: str) -> str:
+    """XDG base directory from variable, or default under the home directory"""
+    base = os.environ.get(variable) or os.path.join(os.path.expanduser("~"), default)
+    return os.path.join(base, APP_DIR_NAME)
+
+
+def get_data_dir() -> str:
+    """Per-user directory for long-lived application state (UCP_DATA_DIR overrides it)
+    
+    On Windows this is under LOCALAPPDATA, elsewhere under XDG_STATE_HOME
+    (~/.local/state), so clearing the cache does not lose the session or
+    usage history.
+    """
+    path = os.environ.get("UCP_DATA_DIR")
+    if not path:
+        if os.environ.get("LOCALAPPDATA"):
+            path = os.path.join(os.environ["LOCALAPPDATA"], APP_DIR_NAME)
+        else:
+            path = _posix_dir("XDG_STATE_HOME", os.path.join(".local", "state"))
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def get_cache_dir() -> str:
+    """Per-user directory for caches that can be rebuilt at any time"""
+    if os.environ.get("UCP_DATA_DIR") or os.environ.get("LOCALAPPDATA"):
+        path = os.path.join(get_data_dir(), "cache")
+    else:
+        path = _posix_dir("XDG_CACHE_HOME", ".cache")
+    os.makedirs(path, exist_ok=True)
+    return path
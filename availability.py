@@ -0,0 +1,217 @@
+# ============================================================================
+# FILE: availability.py
+# ============================================================================
+
+import json
+import os
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from app_paths import get_cache_dir, write_atomic
+from launcher import CommandCompiler, LaunchPlan
+from scheduler import ResultQueue
+
+AVAILABLE = "available"
+UNAVAILABLE = "unavailable"
+UNKNOWN = "unknown"         # Cannot be checked (URIs, shell built-ins)
+
+# Commands run through the shell whose program is one of these are not
+# files, so a failed PATH lookup says nothing about them
+SHELL_BUILTINS = {"start", "call", "cd", "echo", "set", "cmd", "powershell"}
+
+
+def _path_dirs() -> List[str]:
+    return [d for d in os.environ.get("PATH", "").split(os.pathsep) if d]
+
+
+def path_signature() -> str:
+    """Changes whenever a PATH directory gains or loses a file"""
+    parts = []
+    for directory in _path_dirs():
+        try:
+            parts.append(f"{directory}={os.stat(directory).st_mtime_ns}")
+        except OSError:
+            parts.append(f"{directory}=-")
+    return os.pathsep.join(parts)
+
+
+def find_file(name: str) -> Optional[str]:
+    """Find a file (e.g. an .msc snap-in or .cpl applet) directly or on the PATH"""
+    if os.path.dirname(name):
+        return name if os.path.isfile(name) else None
+    for directory in _path_dirs():
+        candidate = os.path.join(directory, name)
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def probe_command(compiler: CommandCompiler, command: str) -> Tuple[str, Optional[str]]:
+    """Check whether a command's target exists; returns (status, target path)"""
+    plan = compiler.compile(command)
+    if plan.kind == LaunchPlan.OPEN:
+        return UNKNOWN, None
+    
+    if plan.kind == LaunchPlan.EXEC:
+        # For snap-ins and applets the file opened matters, not mmc/control
+        for arg in plan.argv[1:]:
+            if os.path.splitext(arg)[1].lower() in compiler.extension_handlers:
+                target = find_file(arg)
+                return (AVAILABLE, target) if target else (UNAVAILABLE, None)
+        return AVAILABLE, plan.argv[0]
+    
+    # A shell plan: the program was not found on the PATH
+    program = command.split(None, 1)[0].strip('"').lower() if command.strip() else ""
+    if not program or program in SHELL_BUILTINS:
+        return UNKNOWN, None
+    return UNAVAILABLE, None
+
+
+class AvailabilityProber:
+    """Checks in the background which settings' commands exist on this host
+    
+    Probes run on a thread pool and are cached on disk. An available command
+    is keyed by its target's path and mtime, so revalidating it costs one
+    stat(); an unavailable one by the PATH directories' mtimes, so it is only
+    probed again once a PATH directory changed. Results are handed to the Tk
+    thread through a ResultQueue.
+    
+    load_cache() takes the cached results as they are, before any of them
+    is revalidated, so the first view can be drawn right on a warm cache.
+    """
+    
+    MAX_WORKERS = 4
+    POLL_INTERVAL_MS = 100
+    FILE_NAME = "availability.json"
+    VERSION = 1
+    
+    def __init__(self, root, compiler: Optional[CommandCompiler] = None,
+                 cache_path: Optional[str] = None):
+        self.root = root
+        self.compiler = compiler or CommandCompiler()
+        self.cache_path = cache_path or os.path.join(get_cache_dir(), self.FILE_NAME)
+        self.status: Dict[str, str] = {}
+        self.results = ResultQueue(root, self._on_results)
+        self.on_changed: Optional[Callable[[Set[str]], None]] = None
+        self.on_done: Optional[Callable[[], None]] = None
+        self._running = False
+    
+    def is_available(self, command: str) -> bool:
+        """False only for commands known to be missing (unprobed ones count as available)"""
+        return self.status.get(command) != UNAVAILABLE
+    
+    def load_cache(self):
+        """Use the cached results until probing confirms or corrects them"""
+        entries = self._read_cache().get("entries")
+        if not isinstance(entries, dict):
+            return
+        for command, entry in entries.items():
+            if isinstance(entry, list) and entry and entry[0] in (AVAILABLE, UNAVAILABLE, UNKNOWN):
+                self.status[command] = entry[0]
+    
+    def probe(self, commands: Iterable[str], on_changed: Callable[[Set[str]], None],
+              on_done: Optional[Callable[[], None]] = None):
+        """Probe commands in the background
+        
+        on_changed(commands) runs on the Tk thread with the commands whose
+        availability changed, and on_done() once every command was probed.
+        """
+        if self._running:
+            return
+        self._running = True
+        self.on_changed = on_changed
+        self.on_done = on_done
+        commands = sorted(set(commands))
+        threading.Thread(target=self._run, args=(commands,), name="probe", daemon=True).start()
+        self.results.poll_in(self.POLL_INTERVAL_MS)
+    
+    def _run(self, commands: List[str]):
+        """Coordinator thread: revalidate the cache and probe the misses"""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        signature = path_signature()
+        cache = self._read_cache()
+        entries = {}
+        misses = []
+        for command in commands:
+            entry = cache.get("entries", {}).get(command)
+            if entry is not None and self._is_valid(entry, cache.get("path_signature"), signature):
+                entries[command] = entry
+                self.results.put((command, entry[0]))
+            else:
+                misses.append(command)
+        
+        def probe(command):
+            try:
+                status, target = probe_command(self.compiler, command)
+            except Exception:
+                status, target = UNKNOWN, None
+            mtime = None
+            if target:
+                try:
+                    mtime = os.stat(target).st_mtime_ns
+                except OSError:
+                    status = UNAVAILABLE
+            self.results.put((command, status))
+            return command, [status, target, mtime]
+        
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS,
+                                thread_name_prefix="probe") as executor:
+            entries.update(executor.map(probe, misses))
+        
+        if misses:
+            self._write_cache({"version": self.VERSION, "path_signature": signature,
+                               "entries": entries})
+        self.results.put(None)
+    
+    @staticmethod
+    def _is_valid(entry, cached_signature: Optional[str], signature: str) -> bool:
+        status, target, mtime = entry
+        if status == AVAILABLE:
+            try:
+                return os.stat(target).st_mtime_ns == mtime
+            except (OSError, TypeError):
+                return False
+        if status == UNAVAILABLE:
+            return cached_signature == signature
+        return True
+    
+    def _on_results(self, results) -> Optional[int]:
+        """Tk thread: apply finished probes and report the changes"""
+        changed = set()
+        finished = False
+        for result in results:
+            if result is None:
+                finished = True
+                break
+            command, status = result
+            if self.is_available(command) != (status != UNAVAILABLE):
+                changed.add(command)
+            self.status[command] = status
+        
+        if changed and self.on_changed:
+            self.on_changed(changed)
+        if not finished:
+            return self.POLL_INTERVAL_MS
+        self._running = False
+        if self.on_done:
+            self.on_done()
+        return None
+    
+    def _read_cache(self) -> dict:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return cache if isinstance(cache, dict) and cache.get("version") == self.VERSION else {}
+    
+    def _write_cache(self, cache: dict):
+        """Write the probe cache atomically (a cache failure is not an error)"""
+        try:
+            write_atomic(self.cache_path, lambda f: json.dump(cache, f))
+        except OSError as e:
+            print(f"Could not write availability cache {self.cache_path}: {e}")
+    
+    def shutdown(self):
+        self.results.stop()
@@ -0,0 +1,292 @@
+# ============================================================================
+# FILE: benchmark.py
+# ============================================================================
+#
+# Headless benchmarks for the UI hot paths: startup, module switching,
+# per-keystroke search and zoom steps, over synthetic catalogs.
+#
+#   xvfb-run python benchmark.py                      # all catalog sizes
+#   python benchmark.py --sizes 10 1000 --withdraw    # on a desktop session
+#   python benchmark.py --output after.json --compare before.json
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import tkinter as tk
+from typing import Callable, Dict, Optional
+
+from main import UnifiedControlPanel
+from modules.base_module import ModuleSetting
+from modules.catalog_module import CatalogModule
+from scheduler import FrameScheduler
+from session_state import SessionState
+from theme import Theme
+from usage_tracker import UsageTracker
+
+DEFAULT_SIZES = [10, 1000, 10000]
+MODULE_COUNT = 10
+
+_WORDS = ("network adapter display sound power device manager disk storage "
+          "printer firewall account user security update backup startup service "
+          "registry policy event viewer performance monitor keyboard mouse "
+          "bluetooth wireless proxy certificate credential remote desktop").split()
+_COMMANDS = ("msinfo32", "devmgmt.msc", "ncpa.cpl", "ms-settings:display",
+             "shell:Downloads", "services.msc", "control /name Microsoft.Sound")
+_COLORS = ("#3b82f6", "#10b981", "#8b5cf6", "#ec4899", "#f97316", "#ef4444")
+
+
+def make_catalog(size: int, seed: int = 1) -> Dict[str, CatalogModule]:
+    """Synthetic catalog of size settings spread over MODULE_COUNT modules
+    
+    The first module is named "System" since that is the startup view.
+    """
+    rng = random.Random(seed)
+    modules = {}
+    for m in range(MODULE_COUNT):
+        name = "System" if m == 0 else f"Category {m}"
+        settings = []
+        for i in range(m, size, MODULE_COUNT):
+            words = rng.sample(_WORDS, 4)
+            settings.append(ModuleSetting(
+                f"{words[0].title()} {words[1].title()} {i}",
+                f"Configure {words[2]} and {words[3]} options",
+                rng.choice(_COMMANDS)
+            ))
+        modules[name] = CatalogModule(name, "⚙️", _COLORS[m % len(_COLORS)], settings)
+    return modules
+
+
+def make_panel_class(catalog: Dict[str, CatalogModule]):
+    """UnifiedControlPanel that loads the given catalog instead of the real modules"""
+    
+    data_dir = tempfile.mkdtemp(prefix="ucp-bench-")
+    
+    class BenchmarkPanel(UnifiedControlPanel):
+        def __init__(self, root):
+            # Never read or overwrite the user's real session and usage data
+            super().__init__(
+                root,
+                session=SessionState(os.path.join(data_dir, "session.json")),
+                usage=UsageTracker(os.path.join(data_dir, "usage.json")),
+                availability_cache=os.path.join(data_dir, "availability.json")
+            )
+        
+        def load_modules(self):
+            self.search_index = None
+            return dict(catalog)
+    
+    return BenchmarkPanel
+
+
+def count_widgets(widget: tk.Misc) -> int:
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def settle(root: tk.Tk, scheduler: Optional[FrameScheduler] = None):
+    """Let Tk process geometry, redraws and idle callbacks
+    
+    With a scheduler, also wait until it ran all of its tasks (e.g. the
+    cards streamed in after the first screenful of a view).
+    """
+    root.update_idletasks()
+    root.update()
+    if scheduler is not None:
+        while len(scheduler):
+            root.update()
+        root.update_idletasks()
+
+
+def measure(root: tk.Tk, operation: Callable[[int], None], repeat: int,
+            scheduler: Optional[FrameScheduler] = None) -> Dict:
+    """Time operation(i) including the Tk work it causes, plus one allocation pass"""
+    timings = []
+    for i in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        operation(i)
+        settle(root, scheduler)
+        timings.append((time.perf_counter() - start) * 1000)
+    
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    operation(repeat)
+    settle(root, scheduler)
+    after = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename")
+                    if stat.size_diff > 0)
+    
+    timings.sort()
+    return {
+        "runs": repeat,
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        "max_ms": round(timings[-1], 3),
+        "alloc_kb": round(allocated / 1024, 1),
+        "peak_kb": round(peak / 1024, 1),
+        "widgets": count_widgets(root),
+    }
+
+
+def run_size(size: int, repeat: int, withdraw: bool) -> Dict:
+    """Run every benchmark against a synthetic catalog of size settings"""
+    catalog = make_catalog(size)
+    panel_class = make_panel_class(catalog)
+    names = list(catalog)
+    results = {}
+    
+    # Startup: a fresh root and panel per run, timed to the first paint and
+    # until the background work (card stream, search index) is done
+    startup = []
+    startup_full = []
+    for _ in range(max(1, repeat // 4)):
+        start = time.perf_counter()
+        root = tk.Tk()
+        if withdraw:
+            root.withdraw()
+        panel = panel_class(root)
+        settle(root)
+        startup.append((time.perf_counter() - start) * 1000)
+        settle(root, panel.scheduler)
+        startup_full.append((time.perf_counter() - start) * 1000)
+        panel.sampler.stop()
+        panel.prober.shutdown()
+        panel.launcher.shutdown()
+        root.destroy()
+    for name, timings in (("startup", startup), ("startup_full", startup_full)):
+        results[name] = {
+            "runs": len(timings),
+            "p50_ms": round(statistics.median(timings), 3),
+            "max_ms": round(max(timings), 3),
+        }
+    
+    root = tk.Tk()
+    if withdraw:
+        root.withdraw()
+    app = panel_class(root)
+    settle(root, app.scheduler)
+    
+    # Module switch, cold: the view is rebuilt every time
+    def switch_cold(i):
+        name = names[1 + i % (len(names) - 1)]
+        app.layout.invalidate_view(name)
+        app.show_module(name)
+    results["module_switch_cold"] = measure(root, switch_cold, repeat, app.scheduler)
+    
+    # Module switch, warm: back and forth between two cached views
+    app.show_module(names[1])
+    app.show_module(names[2])
+    results["module_switch_warm"] = measure(
+        root, lambda i: app.show_module(names[1 + i % 2]), repeat, app.scheduler)
+    
+    # Search: one on_search per keystroke of a few queries, as typed
+    keystrokes = [query[:n] for query in ("network adapter", "disk", "securty", "dm")
+                  for n in range(1, len(query) + 1)]
+    app.get_search_index()
+    results["search_keystroke"] = measure(
+        root, lambda i: app.on_search(keystrokes[i % len(keystrokes)]), max(repeat, len(keystrokes)),
+        app.scheduler)
+    
+    # Clearing the search (back to the active module)
+    results["search_clear"] = measure(root, lambda i: app.on_search(""), repeat, app.scheduler)
+    
+    # Zoom steps with a full search result list on screen
+    app.on_search("e")
+    settle(root, app.scheduler)
+    
+    def zoom(i):
+        if i % 2:
+            app.zoom_manager._zoom_out()
+        else:
+            app.zoom_manager._zoom_in()
+    results["zoom_step"] = measure(root, zoom, repeat, app.scheduler)
+    
+    # clear_content of a full module view
+    def clear(i):
+        app.cancel_card_stream()
+        app.layout.begin_view(names[0])
+        app.show_cards([(catalog[names[0]], s) for s in catalog[names[0]].get_settings()])
+        # Every card is in, and the stream is gone, before the view is cleared
+        settle(root, app.scheduler)
+        app.cancel_card_stream()
+        app.layout.clear_content()
+    results["clear_content"] = measure(root, clear, max(1, repeat // 4), app.scheduler)
+    
+    app.scheduler.cancel_all()
+    app.sampler.stop()
+    app.prober.shutdown()
+    app.launcher.shutdown()
+    root.destroy()
+    Theme.set_zoom_level(1.0)
+    return results
+
+
+def print_results(results: Dict, baseline: Dict = None):
+    for size, benchmarks in results["sizes"].items():
+        print(f"\n=== {size} settings ===")
+        for name, stats in benchmarks.items():
+            line = f"  {name:<20} p50 {stats['p50_ms']:>9.2f} ms"
+            if "p95_ms" in stats:
+                line += (f"  p95 {stats['p95_ms']:>9.2f} ms  alloc {stats['alloc_kb']:>8.1f} KB"
+                         f"  widgets {stats['widgets']:>6}")
+            try:
+                old = baseline["sizes"][size][name]["p50_ms"]
+                change = (stats["p50_ms"] - old) / old * 100 if old else 0.0
+                line += f"  ({change:+.0f}% vs baseline)"
+            except (KeyError, TypeError):
+                pass
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Unified Control Panel UI")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES,
+                        help="synthetic catalog sizes (default: 10 1000 10000)")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per benchmark")
+    parser.add_argument("--withdraw", action="store_true",
+                        help="keep the window withdrawn (no Xvfb needed on a desktop)")
+    parser.add_argument("--renderer", choices=("widgets", "canvas"), default=Theme.CARD_RENDERER,
+                        help="setting card renderer")
+    parser.add_argument("--output", default="bench_results.json", help="JSON results file")
+    parser.add_argument("--compare", help="previous results file to compare against")
+    args = parser.parse_args()
+    Theme.CARD_RENDERER = args.renderer
+    
+    results = {
+        "python": sys.version.split()[0],
+        "tk": tk.TkVersion,
+        "platform": platform.platform(),
+        "renderer": args.renderer,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "sizes": {},
+    }
+    for size in args.sizes:
+        print(f"Benchmarking {size} settings...")
+        # The application logs to stdout on every zoom and search step
+        with contextlib.redirect_stdout(io.StringIO()):
+            results["sizes"][str(size)] = run_size(size, args.repeat, args.withdraw)
+    
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+    
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
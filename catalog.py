@@ -0,0 +1,169 @@
+# ============================================================================
+# FILE: catalog.py
+# ============================================================================
+
+import hashlib
+import json
+import marshal
+import os
+import sys
+from typing import List, Optional, Tuple
+
+from app_paths import get_app_dir, get_cache_dir, write_atomic
+from modules.base_module import ModuleSetting
+from modules.catalog_module import CatalogModule
+
+# Bump when the compiled layout changes. marshal output is only guaranteed
+# to be readable by the Python version that wrote it, so that is part of
+# the cache version too.
+CATALOG_FORMAT_VERSION = 2
+CACHE_VERSION = (CATALOG_FORMAT_VERSION,) + tuple(sys.version_info[:2])
+
+# A compiled catalog: ((name, icon, color, ((name, desc, cmd), ...)), ...)
+CompiledCatalog = Tuple[Tuple[str, str, str, Tuple[Tuple[str, str, str], ...]], ...]
+
+
+def get_catalog_dirs() -> List[str]:
+    """Directories searched for *.json catalogs
+    
+    The bundled catalogs directory, followed by any directories listed in
+    the UCP_CATALOG_PATH environment variable (os.pathsep separated).
+    """
+    dirs = [os.path.join(get_app_dir(), "catalogs")]
+    extra = os.environ.get("UCP_CATALOG_PATH", "")
+    dirs.extend(d for d in extra.split(os.pathsep) if d)
+    return dirs
+
+
+def load_catalogs(directories: Optional[List[str]] = None) -> List[CatalogModule]:
+    """Load every catalog file in the given directories as modules
+    
+    A catalog file holds one category, or a list of categories, in the
+    same shape as BaseModule.to_dict() plus a "name":
+        
+        {"name": "Tools", "icon": "🛠️", "color": "#64748b",
+         "items": [{"name": "...", "desc": "...", "cmd": "..."}]}
+    """
+    if directories is None:
+        directories = get_catalog_dirs()
+    
+    modules = []
+    for directory in directories:
+        if not os.path.isdir(directory):
+            continue
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith(".json"):
+                continue
+            path = os.path.join(directory, file_name)
+            try:
+                stamp = _get_stamp(path)
+                compiled = load_catalog_file(path)
+                file_modules = [
+                    CatalogModule(name, icon, color, [ModuleSetting(*item) for item in items],
+                                  path, stamp)
+                    for name, icon, color, items in compiled
+                ]
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                print(f"Error loading catalog {path}: {e}", file=sys.stderr)
+                continue
+            modules.extend(file_modules)
+    return modules
+
+
+def reload_catalog_module(module: CatalogModule) -> bool:
+    """Reload a catalog module's settings if its file changed
+    
+    Returns True if the settings were replaced. A file that became
+    unreadable, or no longer has the module's category, keeps the old
+    settings.
+    """
+    if module.path is None:
+        return False
+    try:
+        stamp = _get_stamp(module.path)
+        if stamp == module.stamp:
+            return False
+        module.stamp = stamp
+        compiled = load_catalog_file(module.path)
+        for name, icon, color, items in compiled:
+            if name == module.name:
+                settings = [ModuleSetting(*item) for item in items]
+                break
+        else:
+            print(f"Catalog {module.path} no longer has {module.name}", file=sys.stderr)
+            return False
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        print(f"Error reloading catalog {module.path}: {e}", file=sys.stderr)
+        return False
+    module.icon, module.color, module.settings = icon, color, settings
+    return True
+
+
+def load_catalog_file(path: str) -> CompiledCatalog:
+    """Load a catalog file, using its compiled cache while the file is unchanged"""
+    stamp = _get_stamp(path)
+    cache_path = _get_cache_path(path)
+    
+    compiled = _read_cache(cache_path, path, stamp)
+    if compiled is None:
+        with open(path, "r", encoding="utf-8") as f:
+            compiled = compile_catalog(json.load(f))
+        _write_cache(cache_path, path, stamp, compiled)
+    return compiled
+
+
+def _string(value, field: str) -> str:
+    if not isinstance(value, str):
+        raise ValueError(f"{field} must be a string, not {type(value).__name__}")
+    return value
+
+
+def compile_catalog(data) -> CompiledCatalog:
+    """Turn parsed catalog data into its compact compiled form
+    
+    Raises ValueError if a field has the wrong type (e.g. "desc": null).
+    """
+    categories = data if isinstance(data, list) else [data]
+    return tuple(
+        (
+            _string(category["name"], "name"),
+            _string(category.get("icon", ""), "icon"),
+            _string(category.get("color", ""), "color"),
+            tuple((_string(item["name"], "item name"),
+                   _string(item.get("desc", ""), "desc"),
+                   _string(item["cmd"], "cmd"))
+                  for item in category.get("items", ())),
+        )
+        for category in categories
+    )
+
+
+def _get_stamp(path: str) -> Tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _get_cache_path(path: str) -> str:
+    digest = hashlib.sha1(os.path.abspath(path).encode("utf-8")).hexdigest()
+    return os.path.join(get_cache_dir(), f"catalog-{digest}.bin")
+
+
+def _read_cache(cache_path: str, path: str, stamp) -> Optional[CompiledCatalog]:
+    """Read a compiled catalog, or None if missing, stale or unreadable"""
+    try:
+        with open(cache_path, "rb") as f:
+            version, source, source_stamp, compiled = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != CACHE_VERSION or source != os.path.abspath(path) or source_stamp != stamp:
+        return None
+    return compiled
+
+
+def _write_cache(cache_path: str, path: str, stamp, compiled: CompiledCatalog):
+    """Write a compiled catalog atomically (a cache failure is not an error)"""
+    data = (CACHE_VERSION, os.path.abspath(path), stamp, compiled)
+    try:
+        write_atomic(cache_path, lambda f: marshal.dump(data, f), binary=True)
+    except OSError as e:
+        print(f"Could not write catalog cache {cache_path}: {e}", file=sys.stderr)
@@ -0,0 +1,240 @@
+# ============================================================================
+# FILE: launcher.py
+# ============================================================================
+
+import os
+import re
+import shlex
+import shutil
+import subprocess
+from typing import Callable, Dict, Iterable, List, Optional
+
+from modules.base_module import ModuleSetting
+from scheduler import ResultQueue
+
+ERROR_ELEVATION_REQUIRED = 740      # Windows: the program must run elevated
+
+
+class LaunchPlan:
+    """How to start a command, worked out once when it is compiled
+    
+    EXEC plans run a resolved argv directly, without a shell. OPEN plans
+    hand a URI to the OS (ShellExecute on Windows). SHELL plans are the
+    fallback for anything that could not be resolved.
+    """
+    
+    EXEC = "exec"
+    OPEN = "open"
+    SHELL = "shell"
+    
+    __slots__ = ("kind", "command", "argv")
+    
+    def __init__(self, kind: str, command: str, argv: Optional[List[str]] = None):
+        self.kind = kind
+        self.command = command
+        self.argv = argv
+    
+    def spawn(self) -> Optional[subprocess.Popen]:
+        """Start the command; returns the process, if there is one to track"""
+        if self.kind == self.EXEC:
+            try:
+                return subprocess.Popen(self.argv)
+            except OSError as e:
+                # regedit, taskmgr, mmc etc. require elevation, which only
+                # ShellExecute can request (with the UAC prompt)
+                if getattr(e, "winerror", None) != ERROR_ELEVATION_REQUIRED:
+                    raise
+                os.startfile(self.argv[0], arguments=subprocess.list2cmdline(self.argv[1:]))
+                return None
+        if self.kind == self.OPEN:
+            os.startfile(self.command)
+            return None
+        return subprocess.Popen(self.command, shell=True)
+    
+    def __repr__(self) -> str:
+        return f"LaunchPlan({self.kind!r}, {self.command!r}, {self.argv!r})"
+
+
+# Handlers turn a command into a plan. Scheme handlers get the full command
+# ("ms-settings:display"), extension handlers the split argv of a command
+# whose program has that extension ("diskmgmt.msc").
+SchemeHandler = Callable[["CommandCompiler", str], LaunchPlan]
+ExtensionHandler = Callable[["CommandCompiler", str, List[str]], LaunchPlan]
+
+_SCHEME = re.compile(r"^([A-Za-z][A-Za-z0-9+.-]+):")
+
+
+def _explorer(compiler, command):
+    return compiler.exec_plan(command, ["explorer", command])
+
+
+def _shell_open(compiler, command):
+    return LaunchPlan(LaunchPlan.OPEN, command)
+
+
+def _xdg_open(compiler, command):
+    return compiler.exec_plan(command, ["xdg-open", command])
+
+
+def _mmc(compiler, command, argv):
+    return compiler.exec_plan(command, ["mmc"] + argv)
+
+
+def _control(compiler, command, argv):
+    return compiler.exec_plan(command, ["control"] + argv)
+
+
+WINDOWS_SCHEME_HANDLERS: Dict[str, SchemeHandler] = {
+    "shell": _explorer,
+    "*": _shell_open,
+}
+WINDOWS_EXTENSION_HANDLERS: Dict[str, ExtensionHandler] = {
+    ".msc": _mmc,
+    ".cpl": _control,
+}
+POSIX_SCHEME_HANDLERS: Dict[str, SchemeHandler] = {
+    "*": _xdg_open,
+}
+POSIX_EXTENSION_HANDLERS: Dict[str, ExtensionHandler] = {}
+
+
+class CommandCompiler:
+    """Compiles command strings into launch plans, caching plans and PATH lookups
+    
+    The handler tables are pluggable; "*" in the scheme table handles any
+    scheme without its own entry. Defaults depend on the platform.
+    """
+    
+    def __init__(self, scheme_handlers: Optional[Dict[str, SchemeHandler]] = None,
+                 extension_handlers: Optional[Dict[str, ExtensionHandler]] = None,
+                 which: Callable[[str], Optional[str]] = shutil.which):
+        windows = os.name == "nt"
+        if scheme_handlers is None:
+            scheme_handlers = WINDOWS_SCHEME_HANDLERS if windows else POSIX_SCHEME_HANDLERS
+        if extension_handlers is None:
+            extension_handlers = WINDOWS_EXTENSION_HANDLERS if windows else POSIX_EXTENSION_HANDLERS
+        self.scheme_handlers = dict(scheme_handlers)
+        self.extension_handlers = dict(extension_handlers)
+        self.which = which
+        self.posix_split = not windows
+        self._plans: Dict[str, LaunchPlan] = {}
+        self._executables: Dict[str, Optional[str]] = {}
+    
+    def compile(self, command: str) -> LaunchPlan:
+        """Get the launch plan for a command (compiled on first request)"""
+        plan = self._plans.get(command)
+        if plan is None:
+            plan = self._compile(command)
+            self._plans[command] = plan
+        return plan
+    
+    def resolve(self, program: str) -> Optional[str]:
+        """Find an executable on the PATH (cached)"""
+        if program not in self._executables:
+            self._executables[program] = self.which(program)
+        return self._executables[program]
+    
+    def exec_plan(self, command: str, argv: List[str]) -> LaunchPlan:
+        """Plan to run argv directly, or through the shell if argv[0] is not found"""
+        executable = self.resolve(argv[0])
+        if executable is None:
+            return LaunchPlan(LaunchPlan.SHELL, command)
+        return LaunchPlan(LaunchPlan.EXEC, command, [executable] + argv[1:])
+    
+    def _compile(self, command: str) -> LaunchPlan:
+        if '%' in command:
+            command = os.path.expandvars(command)
+        
+        match = _SCHEME.match(command)
+        if match:
+            scheme = match.group(1).lower()
+            handler = self.scheme_handlers.get(scheme) or self.scheme_handlers.get("*")
+            if handler:
+                return handler(self, command)
+        
+        try:
+            argv = shlex.split(command, posix=self.posix_split)
+        except ValueError:
+            return LaunchPlan(LaunchPlan.SHELL, command)
+        if not argv:
+            return LaunchPlan(LaunchPlan.SHELL, command)
+        if not self.posix_split:
+            argv = [arg[1:-1] if len(arg) > 1 and arg[0] == arg[-1] == '"' else arg
+                    for arg in argv]
+        
+        handler = self.extension_handlers.get(os.path.splitext(argv[0])[1].lower())
+        if handler:
+            return handler(self, command, argv)
+        return self.exec_plan(command, argv)
+
+
+class CommandLauncher:
+    """Launches commands on a worker pool so a slow spawn never blocks the UI
+    
+    Workers compile the command to a launch plan (cached) and spawn it.
+    Results are handed back through a ResultQueue to the Tk thread, where
+    the on_done callbacks run. Spawned processes are tracked and reaped once
+    they exit.
+    """
+    
+    MAX_WORKERS = 4
+    POLL_INTERVAL_MS = 50       # Queue drain interval while launches are pending
+    REAP_INTERVAL_MS = 1000     # Child reaping interval while children are alive
+    
+    def __init__(self, root, max_workers: Optional[int] = None,
+                 compiler: Optional[CommandCompiler] = None):
+        # Imported here: concurrent.futures is slow to import and the
+        # command-line mode only needs the compiler
+        from concurrent.futures import ThreadPoolExecutor
+        
+        self.root = root
+        self.compiler = compiler or CommandCompiler()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or self.MAX_WORKERS,
+            thread_name_prefix="launcher"
+        )
+        self.results = ResultQueue(root, self._on_results)
+        self.children: List[subprocess.Popen] = []
+        self.pending = 0
+    
+    def launch(self, setting: ModuleSetting,
+               on_done: Callable[[ModuleSetting, Optional[Exception]], None]):
+        """Launch a setting's command; on_done(setting, error) runs on the Tk thread"""
+        self.pending += 1
+        self.executor.submit(self._spawn, setting, on_done)
+        self.results.poll_in(self.POLL_INTERVAL_MS)
+    
+    def _spawn(self, setting, on_done):
+        """Worker thread: spawn the process and queue the outcome"""
+        try:
+            process = self.compiler.compile(setting.command).spawn()
+        except Exception as e:
+            self.results.put((setting, on_done, None, e))
+        else:
+            self.results.put((setting, on_done, process, None))
+    
+    def precompile(self, settings: Iterable[ModuleSetting]):
+        """Compile the launch plans of settings in the background"""
+        commands = [setting.command for setting in settings]
+        self.executor.submit(lambda: [self.compiler.compile(c) for c in commands])
+    
+    def _on_results(self, results) -> Optional[int]:
+        """Tk thread: deliver finished launches and reap exited children"""
+        for setting, on_done, process, error in results:
+            self.pending -= 1
+            if process is not None:
+                self.children.append(process)
+            on_done(setting, error)
+        
+        self.children = [p for p in self.children if p.poll() is None]
+        
+        if self.pending:
+            return self.POLL_INTERVAL_MS
+        if self.children:
+            return self.REAP_INTERVAL_MS
+        return None
+    
+    def shutdown(self):
+        """Stop accepting launches; running spawns finish in the background"""
+        self.results.stop()
+        self.executor.shutdown(wait=False)
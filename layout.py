@@ -3,11 +3,33 @@
 # ============================================================================
 
 import tkinter as tk
-from ui import ScrollableFrame, SearchBar, SidebarButton
+from collections import OrderedDict
+from ui import CanvasCardList, CardPool, ScrollableFrame, SearchBar, SettingCard, SidebarButton
 from theme import Theme
 from typing import Optional
 
 
+class ContentView:
+    """A built content area (header + cards) that can be swapped in and out"""
+    
+    def __init__(self, parent, key, version, on_create_card):
+        self.key = key
+        self.version = version       # Version of the data the view was built from
+        self.frame = tk.Frame(parent, bg=Theme.BG_DARK)
+        self.card_pool = CardPool(self.frame, on_create=on_create_card)
+        self.virtual = None          # (count, get_card_data) in virtual list mode
+        self.canvas_cards = None     # CanvasCardList with the canvas-drawn cards
+        self.subtitle = None         # Module header subtitle label and its count
+        self.settings_count = 0
+        self.scroll_position = 0.0
+        self.zoom_level = Theme.get_zoom_level()
+    
+    def destroy(self):
+        if self.canvas_cards is not None:
+            self.canvas_cards.destroy()
+        self.frame.destroy()
+
+
 class MainLayout:
     """Handles all UI layout construction for the application"""
     
@@ -19,11 +41,22 @@ class MainLayout:
         # UI component references
         self.sidebar = None
         self.sidebar_buttons = {}
+        self.module_badges = {}      # module name -> live status text
         self.content_frame = None
         self.scroll_frame = None
+        self.search_bar = None
+        
+        # Content views: built module views are kept in an LRU and swapped
+        # in with pack/pack_forget; search results share one transient view
+        self.views = OrderedDict()
+        self.search_view = None
+        self.active_view = None
         
         self.setup_window()
         self.create_layout()
+        
+        if self.zoom_manager:
+            self.zoom_manager.add_listener(self._on_zoom_changed)
     
     def setup_window(self):
         """Configure the main window"""
@@ -71,8 +104,8 @@ class MainLayout:
             self.zoom_manager.register_widget(version, Theme.FONT_VERSION)
         
         # Search bar
-        search_bar = SearchBar(header, on_search=self.on_search_callback)
-        search_bar.pack(side=tk.RIGHT, padx=Theme.HEADER_PADDING_X)
+        self.search_bar = SearchBar(header, on_search=self.on_search_callback)
+        self.search_bar.pack(side=tk.RIGHT, padx=Theme.HEADER_PADDING_X)
     
     def create_main_container(self):
         """Create the main container with sidebar and content area"""
@@ -87,7 +120,6 @@ class MainLayout:
         # Content area
         self.scroll_frame = ScrollableFrame(main_container)
         self.scroll_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        self.content_frame = self.scroll_frame.get_frame()
     
     def create_sidebar(self, parent):
         """Create the category sidebar"""
@@ -123,15 +155,133 @@ class MainLayout:
         self.sidebar_buttons[module_name] = btn
         return btn
     
+    def set_module_badge(self, module_name, badge):
+        """Show a module's live status in the sidebar and its header"""
+        self.module_badges[module_name] = badge
+        button = self.sidebar_buttons.get(module_name)
+        if button is not None:
+            button.set_badge(badge)
+        view = self.views.get(module_name)
+        if view is not None and view.subtitle is not None:
+            view.subtitle.configure(text=Theme.module_subtitle_text(view.settings_count, badge))
+    
     def set_active_sidebar_button(self, module_name):
         """Update sidebar button states to show active module"""
         for name, btn in self.sidebar_buttons.items():
             btn.set_active(name == module_name)
     
+    def show_view(self, key, version=None) -> bool:
+        """Swap in the cached view for key, if there is one built from version"""
+        view = self.views.get(key)
+        if view is None:
+            return False
+        if view.version != version or view.zoom_level != Theme.get_zoom_level():
+            self.invalidate_view(key)
+            return False
+        
+        if view is not self.active_view:
+            self._activate_view(view)
+        self.views.move_to_end(key)
+        return True
+    
+    def begin_view(self, key=None, version=None):
+        """Start building a new, empty view
+        
+        Views with a key are cached for show_view(), along with the version of
+        the data they show; key None is the transient search results view,
+        which is reused and cleared on every call.
+        """
+        if key is None:
+            if self.search_view is None:
+                self.search_view = ContentView(self.scroll_frame.get_frame(), None, None,
+                                               self._register_card)
+            view = self.search_view
+        else:
+            self.invalidate_view(key)
+            view = ContentView(self.scroll_frame.get_frame(), key, version,
+                               self._register_card)
+            self.views[key] = view
+            while len(self.views) > Theme.VIEW_CACHE_SIZE:
+                _, evicted = self.views.popitem(last=False)
+                evicted.destroy()
+        
+        view.scroll_position = 0.0
+        if view is not self.active_view:
+            self._activate_view(view)
+        else:
+            self.scroll_frame.canvas.yview_moveto(0)
+        self.clear_content()
+    
+    def invalidate_view(self, key):
+        """Drop the cached view for key so the next visit rebuilds it"""
+        view = self.views.pop(key, None)
+        if view is None:
+            return
+        if view is self.active_view:
+            self.scroll_frame.clear_virtual_rows()
+            self.scroll_frame.clear_canvas_content()
+            self.active_view = None
+            self.content_frame = None
+        view.destroy()
+    
+    def _activate_view(self, view):
+        """Hide the active view, remembering its scroll position, and show view"""
+        current = self.active_view
+        if current is not None:
+            current.scroll_position = self.get_scroll_position()
+            self.scroll_frame.clear_virtual_rows()
+            self.scroll_frame.clear_canvas_content()
+            current.frame.pack_forget()
+        
+        self.active_view = view
+        self.content_frame = view.frame
+        view.frame.pack(fill=tk.X)
+        
+        if view.virtual is not None:
+            self.show_virtual_cards(*view.virtual)
+        elif view.canvas_cards is not None and view.canvas_cards.count:
+            self.scroll_frame.set_canvas_content(view.canvas_cards)
+        # Restored once the new view's scroll region is known
+        self.scroll_frame.scroll_to(view.scroll_position)
+    
+    def get_scroll_position(self) -> float:
+        """Get the scroll position of the content area (0.0 = top)"""
+        return self.scroll_frame.get_scroll_position()
+    
+    def set_scroll_position(self, fraction: float):
+        """Scroll the content area once its scroll region is known"""
+        if self.active_view is not None:
+            self.active_view.scroll_position = fraction
+        self.scroll_frame.scroll_to(fraction)
+    
+    def invalidate_all_views(self):
+        """Drop every cached module view (e.g. after the data they show changed)"""
+        for key in list(self.views):
+            self.invalidate_view(key)
+    
+    def _on_zoom_changed(self):
+        """Drop hidden views built at another zoom level"""
+        if self.active_view is not None:
+            self.active_view.zoom_level = Theme.get_zoom_level()
+            # Canvas-drawn cards use the zoomed fonts but need a new layout
+            self.scroll_frame.refresh_canvas_content()
+        for key, view in list(self.views.items()):
+            if view is not self.active_view:
+                self.invalidate_view(key)
+    
     def clear_content(self):
-        """Clear all widgets from the content area"""
+        """Clear all widgets from the content area (setting cards are recycled)"""
+        view = self.active_view
+        self.scroll_frame.clear_virtual_rows()
+        self.scroll_frame.clear_canvas_content()
+        view.virtual = None
+        view.subtitle = None
+        if view.canvas_cards is not None:
+            view.canvas_cards.clear()
+        view.card_pool.release_all()
         for widget in self.content_frame.winfo_children():
-            widget.destroy()
+            if not view.card_pool.owns(widget):
+                widget.destroy()
     
     def create_module_header(self, module_icon, module_name, settings_count):
         """Create a header for a module view"""
@@ -151,7 +301,7 @@ class MainLayout:
         
         subtitle = tk.Label(
             header,
-            text=Theme.settings_count_text(settings_count),
+            text=Theme.module_subtitle_text(settings_count, self.module_badges.get(module_name)),
             font=Theme.FONT_MODULE_SUBTITLE,
             bg=Theme.BG_DARK,
             fg=Theme.TEXT_SECONDARY
@@ -159,6 +309,8 @@ class MainLayout:
         subtitle.pack(anchor="w", pady=Theme.CONTENT_MODULE_SUBTITLE_PADDING_Y)
         if self.zoom_manager:
             self.zoom_manager.register_widget(subtitle, Theme.FONT_MODULE_SUBTITLE)
+        self.active_view.subtitle = subtitle
+        self.active_view.settings_count = settings_count
         
         return header
     
@@ -193,6 +345,88 @@ class MainLayout:
         if self.zoom_manager:
             self.zoom_manager.register_widget(no_results, Theme.FONT_NO_RESULTS)
     
+    def acquire_card(self, name, description, command, color, key=None, busy=False,
+                     available=True):
+        """Get a setting card for the content area from the card pool"""
+        return self.active_view.card_pool.acquire(name, description, command, color,
+                                                  key, busy, available)
+    
+    def iter_cards(self):
+        """Iterate over every setting card currently bound to a setting"""
+        views = list(self.views.values())
+        if self.search_view is not None:
+            views.append(self.search_view)
+        for view in views:
+            yield from view.card_pool.in_use
+        yield from self.scroll_frame.get_virtual_rows()
+    
+    def set_card_busy(self, key, busy):
+        """Show or clear the in-flight state of the cards showing key"""
+        for card in self.iter_cards():
+            if card.key == key:
+                card.set_busy(busy)
+        if self.active_view is not None and self.active_view.canvas_cards is not None:
+            self.active_view.canvas_cards.set_busy(key, busy)
+    
+    def set_cards_available(self, available_by_key):
+        """Grey out or restore the cards whose key is in available_by_key
+        
+        Updates the built cards in place; cards bound later (virtual rows,
+        canvas cards scrolled into view) ask for their data anyway.
+        """
+        for card in self.iter_cards():
+            available = available_by_key.get(card.key)
+            if available is not None:
+                card.set_available(available)
+        if self.active_view is not None and self.active_view.canvas_cards is not None:
+            self.active_view.canvas_cards.set_available(available_by_key)
+    
+    def show_virtual_cards(self, count, get_card_data):
+        """Show count setting cards as a virtualized list below the header
+        
+        get_card_data(index) returns the acquire_card() arguments for a card;
+        it is only called for cards scrolled into view.
+        """
+        self.active_view.virtual = (count, get_card_data)
+        
+        def create_row(parent):
+            card = SettingCard(parent, name="", description="",
+                               command=lambda: None, color=Theme.BG_CARD)
+            self._register_card(card)
+            return card
+        
+        def bind_row(card, index):
+            card.update_content(**get_card_data(index))
+        
+        self.scroll_frame.set_virtual_rows(
+            count,
+            create_row=create_row,
+            bind_row=bind_row,
+            row_spacing=2 * Theme.CONTENT_CARD_PADDING_Y
+        )
+    
+    def show_canvas_cards(self, count, get_card_data):
+        """Show count setting cards drawn on the canvas below the header
+        
+        Takes the same get_card_data(index) as show_virtual_cards(); only the
+        cards in view are drawn, without any widgets.
+        """
+        view = self.active_view
+        if view.canvas_cards is None:
+            name_font = desc_font = None
+            if self.zoom_manager:
+                name_font = self.zoom_manager.get_font(Theme.FONT_CARD_NAME)
+                desc_font = self.zoom_manager.get_font(Theme.FONT_CARD_DESCRIPTION)
+            view.canvas_cards = CanvasCardList(self.scroll_frame.canvas, name_font, desc_font)
+        view.canvas_cards.set_cards(count, get_card_data)
+        self.scroll_frame.set_canvas_content(view.canvas_cards)
+    
+    def _register_card(self, card):
+        """Register a newly created card's labels with the zoom manager"""
+        if self.zoom_manager:
+            self.zoom_manager.register_widget(card.name_label, Theme.FONT_CARD_NAME)
+            self.zoom_manager.register_widget(card.desc_label, Theme.FONT_CARD_DESCRIPTION)
+    
     def add_setting_card(self, card):
         """Add a setting card to the content area"""
         card.pack(fill=tk.X, pady=Theme.CONTENT_CARD_PADDING_Y)
@@ -0,0 +1,160 @@
+# ============================================================================
+# FILE: loop_watchdog.py
+# ============================================================================
+
+import bisect
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import List, Optional
+
+from app_paths import get_data_dir
+
+
+class EventLoopWatchdog:
+    """Detects stalls of the Tk main loop
+    
+    A heartbeat is scheduled with root.after every HEARTBEAT_MS and the
+    lateness of each beat goes into a histogram. Optionally, a sampling
+    thread watches the heartbeat and, once it is overdue by more than the
+    stall threshold, captures the main thread's stack while it is still
+    stuck. Stalls, stacks and the histogram are appended to a log file.
+    """
+    
+    HEARTBEAT_MS = 100
+    STALL_THRESHOLD_MS = 250
+    HISTOGRAM_BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2000, 5000)
+    
+    def __init__(self, root, log_path: str, threshold_ms: Optional[int] = None,
+                 sample_stacks: bool = True):
+        self.root = root
+        self.log_path = log_path
+        self.threshold = (threshold_ms or self.STALL_THRESHOLD_MS) / 1000
+        self.sample_stacks = sample_stacks
+        
+        # histogram[i] counts beats late by < HISTOGRAM_BUCKETS_MS[i],
+        # the last bucket counts everything later than that
+        self.histogram = [0] * (len(self.HISTOGRAM_BUCKETS_MS) + 1)
+        self.stalls = 0
+        self.worst_ms = 0.0
+        
+        self._expected = 0.0
+        self._after_id = None
+        self._running = False
+        self._captured = False      # Stack already captured for the current stall
+        self._lock = threading.Lock()
+        self._main_thread_id = threading.main_thread().ident
+        self._sampler: Optional[threading.Thread] = None
+    
+    def start(self):
+        """Start the heartbeat (and the sampling thread)"""
+        if self._running:
+            return
+        self._running = True
+        self._log(f"Watchdog started (heartbeat {self.HEARTBEAT_MS} ms, "
+                  f"stall threshold {self.threshold * 1000:.0f} ms)")
+        self._schedule()
+        if self.sample_stacks:
+            self._sampler = threading.Thread(target=self._sample, name="watchdog", daemon=True)
+            self._sampler.start()
+    
+    def stop(self):
+        """Stop watching and log the lateness histogram"""
+        if not self._running:
+            return
+        self._running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass  # The root may already be destroyed
+            self._after_id = None
+        self._log(self.histogram_text())
+    
+    def _schedule(self):
+        self._expected = time.perf_counter() + self.HEARTBEAT_MS / 1000
+        self._captured = False
+        self._after_id = self.root.after(self.HEARTBEAT_MS, self._heartbeat)
+    
+    def _heartbeat(self):
+        """Main thread: measure how late this beat fired"""
+        late_ms = max(0.0, (time.perf_counter() - self._expected) * 1000)
+        self.histogram[bisect.bisect_right(self.HISTOGRAM_BUCKETS_MS, late_ms)] += 1
+        self.worst_ms = max(self.worst_ms, late_ms)
+        if late_ms >= self.threshold * 1000:
+            self.stalls += 1
+            self._log(f"Stall: main loop blocked for {late_ms:.0f} ms")
+        if self._running:
+            self._schedule()
+    
+    def _sample(self):
+        """Sampling thread: capture the main thread's stack during a stall"""
+        interval = self.threshold / 2
+        while self._running:
+            time.sleep(interval)
+            overdue = time.perf_counter() - self._expected
+            if overdue >= self.threshold and not self._captured:
+                self._captured = True
+                frame = sys._current_frames().get(self._main_thread_id)
+                if frame is not None:
+                    stack = "".join(traceback.format_stack(frame))
+                    self._log(f"Stall in progress ({overdue * 1000:.0f} ms), "
+                              f"main thread stack:\n{stack}")
+    
+    def histogram_text(self) -> str:
+        """Lateness histogram as one log line"""
+        labels = [f"<{b}ms" for b in self.HISTOGRAM_BUCKETS_MS]
+        labels.append(f">={self.HISTOGRAM_BUCKETS_MS[-1]}ms")
+        buckets = ", ".join(f"{label}: {count}" for label, count in zip(labels, self.histogram))
+        return (f"Heartbeat lateness: {buckets}; stalls: {self.stalls}, "
+                f"worst: {self.worst_ms:.0f} ms")
+    
+    def _log(self, message: str):
+        line = f"{time.strftime('%Y-%m-%d %H:%M:%S')} [{os.getpid()}] {message}\n"
+        with self._lock:
+            try:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(line)
+            except OSError as e:
+                print(f"Watchdog could not write to {self.log_path}: {e}")
+
+
+def _threshold_from_environment() -> Optional[int]:
+    """UCP_WATCHDOG_THRESHOLD_MS as a positive int; None (the default) if unset or invalid"""
+    value = os.environ.get("UCP_WATCHDOG_THRESHOLD_MS")
+    if not value:
+        return None
+    try:
+        threshold = int(value)
+    except ValueError:
+        threshold = 0
+    if threshold <= 0:
+        print(f"Ignoring UCP_WATCHDOG_THRESHOLD_MS={value!r}: not a positive number of ms, "
+              f"using {EventLoopWatchdog.STALL_THRESHOLD_MS} ms", file=sys.stderr)
+        return None
+    return threshold
+
+
+def start_from_environment(root, argv: Optional[List[str]] = None) -> Optional[EventLoopWatchdog]:
+    """Start a watchdog if --watchdog[=LOG] or UCP_WATCHDOG is given
+    
+    UCP_WATCHDOG holds the log path ("1" uses watchdog.log in the data
+    directory); UCP_WATCHDOG_THRESHOLD_MS overrides the stall threshold.
+    """
+    path = os.environ.get("UCP_WATCHDOG")
+    for arg in argv or ():
+        if arg == "--watchdog":
+            path = path or "1"
+        elif arg.startswith("--watchdog="):
+            path = arg.split("=", 1)[1]
+    if not path:
+        return None
+    if path == "1":
+        path = os.path.join(get_data_dir(), "watchdog.log")
+    
+    watchdog = EventLoopWatchdog(root, path, threshold_ms=_threshold_from_environment())
+    watchdog.start()
+    print(f"Event loop watchdog logging to {path}")
+    return watchdog
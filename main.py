@@ -2,67 +2,205 @@
 # FILE: main.py
 # ============================================================================
 
-import subprocess
 from tkinter import messagebox
+import sys
+import time
 import traceback
-import os
 import tkinter as tk
+from typing import Dict, Optional, Sequence, Tuple
 
 from ui import SettingCard
-from modules import *
+from availability import AvailabilityProber
+from catalog import reload_catalog_module
+from modules.base_module import BaseModule, ModuleSetting
+from modules.catalog_module import CatalogModule
+from modules.frequent_module import FrequentModule
+from plugin_registry import discover_modules
+from launcher import CommandLauncher
 from layout import MainLayout
+from loop_watchdog import start_from_environment
+from metrics import MetricSampler
+from scheduler import PRIORITY_HIGH, PRIORITY_LOW, FrameScheduler
+from search_index import SearchIndex
+from session_state import SessionState
+from theme import Theme
+from tracing import enable_from_environment, tracer
+from usage_tracker import UsageTracker
 from zoom_manager import ZoomManager
 
 
 class UnifiedControlPanel:
     """Main application class - handles business logic and coordination"""
     
-    def __init__(self, root):
+    CATALOG_CHECK_INTERVAL_MS = 2000    # How often catalog files are checked for edits
+    
+    def __init__(self, root, session: Optional[SessionState] = None,
+                 usage: Optional[UsageTracker] = None,
+                 availability_cache: Optional[str] = None):
         self.root = root
         
+        # Restore the previous session's zoom before any font is created
+        self.session = session or SessionState().load()
+        self.session.attach(root)
+        Theme.set_zoom_level(self.session.get("zoom_level", Theme.get_zoom_level()))
+        
         # Initialize zoom manager
-        self.zoom_manager = ZoomManager(root)
+        with tracer.span("zoom_manager"):
+            self.zoom_manager = ZoomManager(root)
+        self.zoom_manager.add_listener(self.on_zoom_changed)
+        
+        # Commands are spawned on worker threads
+        self.launcher = CommandLauncher(root)
+        self.launches_in_flight = set()
+        
+        # Missing commands are found in the background and greyed out; the
+        # last run's results are used for the first paint
+        self.prober = AvailabilityProber(root, self.launcher.compiler, availability_cache)
+        self.prober.load_cache()
+        self.availability_changed = False
+        
+        # Long-running UI work is run in short slices between events
+        self.scheduler = FrameScheduler(root)
+        self.card_stream = None          # (task, view key) of the cards being streamed in
+        
+        # Launch counts for frecency ranking (saved in batches)
+        self.usage = usage or UsageTracker().load()
+        self.usage.attach(root)
         
         # Load all modules
-        self.modules = self.load_modules()
+        with tracer.span("load_modules"):
+            self.modules = self.load_modules()
+        
+        # The quick-launch list comes first in the sidebar
+        self.frequent_module = FrequentModule(self.usage, self.modules)
+        self.modules = {self.frequent_module.get_name(): self.frequent_module, **self.modules}
         
         # Create UI layout
-        self.layout = MainLayout(root, on_search_callback=self.on_search, zoom_manager=self.zoom_manager)
+        with tracer.span("main_layout"):
+            self.layout = MainLayout(root, on_search_callback=self.on_search, zoom_manager=self.zoom_manager)
+        
+        # Restore the window size and position
+        if self.session.get("geometry"):
+            root.geometry(self.session.get("geometry"))
+        if self.session.get("window_state") == "zoomed":
+            try:
+                root.state("zoomed")
+            except tk.TclError:
+                pass  # Not supported by this window manager
         
         # Build sidebar with module buttons
-        self.build_sidebar()
+        with tracer.span("build_sidebar"):
+            self.build_sidebar()
+        
+        # Show the module that was active last time (or the default one)
+        # (show_module() resets the saved scroll position, so read it first)
+        start_module = self.session.get("active_module")
+        scroll_position = self.session.get("scroll_position", 0.0)
+        if start_module not in self.modules:
+            start_module = "System"
+        with tracer.span("show_module", module=start_module):
+            self.show_module(start_module)
+        self.restore_scroll_position(scroll_position)
         
-        # Show default module
-        self.show_module("System")
+        # Build the search index in the background once the window is up
+        self.index_task = self.scheduler.schedule(self._build_search_index(), PRIORITY_LOW)
+        
+        # Live status badges, sampled on one thread while the window is shown
+        self.sampler = MetricSampler(root)
+        self.scheduler.schedule(self._start_metrics(), PRIORITY_LOW)
+        root.bind("<Unmap>", self._on_window_unmap, add="+")
+        root.bind("<Map>", self._on_window_map, add="+")
+        
+        # Edited catalog files are picked up while the app is running
+        self.root.after(self.CATALOG_CHECK_INTERVAL_MS, self._check_catalogs)
+        
+        root.bind("<Configure>", self._on_window_configure, add="+")
+        root.protocol("WM_DELETE_WINDOW", self.on_close)
         
         print("UI initialized successfully!")
         print("Tip: Use Ctrl+MouseWheel to zoom, Ctrl+0 to reset")
     
+    def on_zoom_changed(self):
+        """Remember the zoom level for the next session"""
+        self.session.update(zoom_level=Theme.get_zoom_level())
+    
+    def _on_window_configure(self, event):
+        # The root's bindings also see every child's <Configure>
+        if event.widget is not self.root:
+            return
+        # Only a normal window's geometry is worth restoring
+        state = self.root.state()
+        if state == "normal":
+            self.session.update(geometry=self.root.geometry(), window_state=state)
+        else:
+            self.session.update(window_state=state)
+    
+    def _start_metrics(self):
+        """Collect the modules' metrics and start sampling (run by the scheduler)"""
+        for module_name, module in self.modules.items():
+            for metric in module.get_metrics():
+                self.sampler.add(module_name, metric)
+            yield
+        self.sampler.start(self.on_metrics_changed)
+    
+    def on_metrics_changed(self, module_name: str, texts):
+        """Show a module's changed live values in the sidebar and its header"""
+        self.layout.set_module_badge(module_name, " · ".join(texts))
+    
+    def _on_window_unmap(self, event):
+        # Minimized: nothing is visible, so stop sampling
+        if event.widget is self.root:
+            self.sampler.pause()
+    
+    def _on_window_map(self, event):
+        if event.widget is self.root:
+            self.sampler.resume()
+    
+    def on_close(self):
+        """Save the session state and close the window"""
+        self.session.update(
+            scroll_position=self.layout.get_scroll_position(),
+            window_state=self.root.state()
+        )
+        if self.root.state() == "normal":
+            self.session.update(geometry=self.root.geometry())
+        self.session.save()
+        self.usage.flush()
+        self.root.destroy()
+    
     def load_modules(self) -> Dict[str, BaseModule]:
-        """Load all module instances"""
-        modules = {}
-        module_classes = [
-            SystemModule,
-            NetworkModule,
-            DevicesModule,
-            PersonalizationModule,
-            AccountsModule,
-            SecurityModule,
-            AppsModule,
-            ServicesModule,
-            StorageModule,
-        ]
-        
-        for module_class in module_classes:
-            module = module_class()
-            modules[module.get_name()] = module
+        """Discover all modules - their code is imported on first use"""
+        modules = discover_modules()
+        
+        # The search index is built after startup (or on the first search),
+        # so that startup only imports the code of the module that is shown
+        self.search_index = None
+        self.index_task = None
         
         return modules
     
+    def _build_search_index(self):
+        """Build the search index step by step (run by the scheduler)"""
+        index = SearchIndex()
+        yield from index.build_steps(self.modules)
+        self.launcher.precompile(entry.setting for entry in index.entries)
+        self.prober.probe((entry.setting.command for entry in index.entries),
+                          self.on_availability_changed, self.on_probing_done)
+        self.search_index = index
+    
+    def get_search_index(self) -> SearchIndex:
+        """Get the search index, building it if needed"""
+        if self.index_task is not None:
+            # Complete a background build right away
+            self.index_task.finish()
+            self.index_task = None
+        if self.search_index is None:
+            for _ in self._build_search_index():
+                pass
+        return self.search_index
+    
     def build_sidebar(self):
         """Build the category sidebar with module buttons"""
-        from theme import Theme
-        
         for module_name, module in self.modules.items():
             btn = self.layout.add_sidebar_button(
                 module_name=module_name,
@@ -72,37 +210,100 @@ class UnifiedControlPanel:
             # Register button with zoom manager
             self.zoom_manager.register_widget(btn, Theme.FONT_SIDEBAR_BUTTON)
     
+    def card_data(self, module: BaseModule, setting: ModuleSetting) -> dict:
+        """Get the data a setting card displays"""
+        module = module.get_setting_module(setting)
+        return {
+            "name": setting.name,
+            "description": f"{setting.description} ({setting.command})",
+            "command": lambda s=setting, m=module: self.execute_command(s, m),
+            "color": module.get_color(),
+            "key": setting.id,
+            "busy": setting.id in self.launches_in_flight,
+            "available": self.prober.is_available(setting.command),
+        }
+    
     def build_card(self, module: BaseModule, setting: ModuleSetting) -> SettingCard:
         """Build a setting card for display"""
-        from theme import Theme
-        
-        card = SettingCard(
-            self.layout.get_content_frame(),
-            name=setting.name,
-            description=f"{setting.description} ({setting.command})",
-            command=lambda s=setting: self.execute_command(s),
-            color=module.get_color()
-        )
+        return self.layout.acquire_card(**self.card_data(module, setting))
+    
+    def show_cards(self, items: Sequence[Tuple[BaseModule, ModuleSetting]]):
+        """Add cards for (module, setting) pairs below the current header
+        
+        The first screenful is built right away; the rest are streamed in by
+        the scheduler, so the view paints without waiting for the last card.
+        """
+        # Canvas-drawn cards only ever draw the cards that are in view
+        if Theme.CARD_RENDERER == "canvas":
+            self.layout.show_canvas_cards(
+                len(items),
+                lambda index: self.card_data(*items[index])
+            )
+            return
+        
+        # Long lists only materialize the cards that are scrolled into view
+        if len(items) > Theme.VIRTUAL_LIST_THRESHOLD:
+            self.layout.show_virtual_cards(
+                len(items),
+                lambda index: self.card_data(*items[index])
+            )
+            return
         
-        # Register card labels with zoom manager
-        if hasattr(card, 'name_label') and hasattr(card, 'desc_label'):
-            self.zoom_manager.register_widget(card.name_label, Theme.FONT_CARD_NAME)
-            self.zoom_manager.register_widget(card.desc_label, Theme.FONT_CARD_DESCRIPTION)
+        first = Theme.FIRST_PAINT_CARDS
+        for module, setting in items[:first]:
+            card = self.build_card(module, setting)
+            self.layout.add_setting_card(card)
         
-        return card
+        if len(items) > first:
+            task = self.scheduler.schedule(self._stream_cards(items[first:]), PRIORITY_HIGH)
+            self.card_stream = (task, self.layout.active_view.key)
+    
+    def restore_scroll_position(self, fraction: float):
+        """Scroll the view just shown, once all of its cards are in"""
+        self.layout.set_scroll_position(fraction)
+        if self.card_stream is not None and self.card_stream[0].pending:
+            # A fraction of the first screenful is not the same position
+            self.card_stream[0].on_done = lambda: self.layout.set_scroll_position(fraction)
+    
+    def _stream_cards(self, items: Sequence[Tuple[BaseModule, ModuleSetting]]):
+        for module, setting in items:
+            card = self.build_card(module, setting)
+            self.layout.add_setting_card(card)
+            yield
+    
+    def cancel_card_stream(self):
+        """Stop streaming cards into the current view before another is shown"""
+        if self.card_stream is None:
+            return
+        task, key = self.card_stream
+        self.card_stream = None
+        if task.pending:
+            task.cancel()
+            # Never reuse a half-built module view from the cache
+            if key is not None:
+                self.layout.invalidate_view(key)
     
     def show_module(self, module_name: str):
         """Display settings for a specific module"""
+        self.cancel_card_stream()
         self.active_module = module_name
+        self.session.update(active_module=module_name, scroll_position=0.0)
         
         # Update sidebar
         self.layout.set_active_sidebar_button(module_name)
         
-        # Clear and rebuild content
-        self.layout.clear_content()
-        
         module = self.modules[module_name]
+        
+        # Swap in the cached view if this module was built before
+        if self.layout.show_view(module_name, module.settings_version):
+            return
+        
+        # Build a new view
+        self.layout.begin_view(module_name, module.settings_version)
         settings = module.get_settings()
+        self.launcher.precompile(settings)
+        if Theme.UNAVAILABLE_SETTINGS == "hide":
+            settings = [s for s in settings if self.prober.is_available(s.command)]
         
         # Create header
         self.layout.create_module_header(
@@ -112,30 +313,77 @@ class UnifiedControlPanel:
         )
         
         # Add setting cards
-        for setting in settings:
-            card = self.build_card(module, setting)
-            self.layout.add_setting_card(card)
+        self.show_cards([(module, setting) for setting in settings])
     
-    def execute_command(self, setting: ModuleSetting):
-        """Execute a control panel command"""
+    def on_availability_changed(self, commands):
+        """Grey out (or restore) the cards of commands found missing (or back)"""
+        print(f"Availability changed for {len(commands)} command(s)")
+        if Theme.UNAVAILABLE_SETTINGS == "hide":
+            # Hiding changes which cards exist: rebuild once probing is done
+            self.availability_changed = True
+            return
+        
+        index = self.search_index or self.get_search_index()
+        self.layout.set_cards_available({
+            entry.setting.id: self.prober.is_available(entry.setting.command)
+            for entry in index.entries if entry.setting.command in commands
+        })
+    
+    def on_probing_done(self):
+        """Rebuild the views once if probing changed which settings are hidden"""
+        if not self.availability_changed:
+            return
+        self.availability_changed = False
+        view = self.layout.active_view
+        showing_module = view is not None and view.key is not None
+        position = self.layout.get_scroll_position()
+        self.layout.invalidate_all_views()
+        if showing_module:
+            self.show_module(self.active_module)
+            self.restore_scroll_position(position)
+    
+    def _check_catalogs(self):
+        """Reload the catalog modules whose file changed since it was read"""
+        for module_name, module in self.modules.items():
+            if isinstance(module, CatalogModule) and reload_catalog_module(module):
+                print(f"Catalog changed: reloading {module_name}")
+                self.invalidate_module(module_name)
+        self.root.after(self.CATALOG_CHECK_INTERVAL_MS, self._check_catalogs)
+    
+    def invalidate_module(self, module_name: str):
+        """Pick up changed settings of a module on its next view or search"""
+        self.modules[module_name].invalidate_settings()
+        self.frequent_module.invalidate_settings()
+        if self.index_task is not None:
+            self.index_task.cancel()
+            self.index_task = None
+        self.search_index = None
+        if getattr(self, 'active_module', None) == module_name:
+            position = self.layout.get_scroll_position()
+            self.show_module(module_name)
+            self.restore_scroll_position(position)
+    
+    def execute_command(self, setting: ModuleSetting, module: BaseModule):
+        """Execute a control panel command (spawned in the background)"""
+        if setting.id in self.launches_in_flight:
+            return
         print(f"Executing: {setting.command}")
-        try:
-            cmd = setting.command
-
-            if '%' in cmd:
-                cmd = os.path.expandvars(cmd)
+        # Only recorded in memory here; the tracker saves in batches
+        self.usage.record(module.get_name(), setting.name)
+        self.frequent_module.invalidate_settings()
+        self.launches_in_flight.add(setting.id)
+        self.layout.set_card_busy(setting.id, True)
+        self.launcher.launch(setting, self.on_command_done)
     
-            if cmd.startswith("shell:"):
-                subprocess.Popen(['explorer', cmd], shell=True)
-            elif cmd.startswith("ms-settings:") or cmd == "windowsdefender:":
-                subprocess.Popen(["start", cmd], shell=True)
-            else:
-                subprocess.Popen(cmd, shell=True)
-
+    def on_command_done(self, setting: ModuleSetting, error: Optional[Exception]):
+        """Report the outcome of a launch (called on the Tk thread)"""
+        self.launches_in_flight.discard(setting.id)
+        self.layout.set_card_busy(setting.id, False)
+        if error is None:
             print(f"Command executed successfully: {setting.name}")
-        except Exception as e:
-            print(f"Error executing {setting.name}: {e}")
-            messagebox.showerror("Error", f"Failed to open {setting.name}:\n{str(e)}")
+        else:
+            print(f"Error executing {setting.name}: {error}")
+            messagebox.showerror("Error", f"Failed to open {setting.name}:\n{str(error)}")
     
     def on_search(self, query: str):
         """Filter settings based on search query"""
@@ -150,33 +398,59 @@ class UnifiedControlPanel:
             return
         
         # Clear content and show search header
-        self.layout.clear_content()
+        self.cancel_card_stream()
+        self.layout.begin_view()
         self.layout.create_search_header(query)
         
-        # Search through all modules
-        found = False
-        for module_name, module in self.modules.items():
-            for setting in module.get_settings():
-                if (query in setting.name.lower() or 
-                    query in setting.description.lower() or
-                    query in setting.command):
-                    card = self.build_card(module, setting)
-                    self.layout.add_setting_card(card)
-                    found = True
+        # Look up the best matching settings in the prebuilt index
+        # Cached and narrowed per keystroke by the index; the frecency boost
+        # is only applied once something was launched
+        boost = None
+        if self.usage.entries:
+            boost = lambda entry: self.usage.search_boost(entry.module.get_name(), entry.setting.name)
+        results = self.get_search_index().search_ranked(
+            query,
+            limit=Theme.SEARCH_RESULT_LIMIT,
+            boost=boost
+        )
+        if Theme.UNAVAILABLE_SETTINGS == "hide":
+            results = [entry for entry in results if self.prober.is_available(entry.setting.command)]
+        self.show_cards([(entry.module, entry.setting) for entry in results])
         
         # Show no results message if nothing found
-        if not found:
+        if not results:
             self.layout.show_no_results_message()
 
 
+def report_startup_trace(mainloop_start: float):
+    """Record the first idle of the main loop and write the startup trace"""
+    tracer.add_event("first_idle", mainloop_start, time.perf_counter())
+    print(tracer.summary())
+    try:
+        print(f"Trace written to {tracer.write()}")
+    except OSError as e:
+        print(f"Could not write trace: {e}")
+
+
 def main():
     try:
+        enable_from_environment(sys.argv[1:])
         print("Creating main window...")
-        root = tk.Tk()
+        with tracer.span("tk_init"):
+            root = tk.Tk()
         print("Initializing application...")
-        app = UnifiedControlPanel(root)
+        with tracer.span("app_init"):
+            app = UnifiedControlPanel(root)
         print("Starting main loop...")
+        if tracer.enabled:
+            root.after_idle(report_startup_trace, time.perf_counter())
+        watchdog = start_from_environment(root, sys.argv[1:])
         root.mainloop()
+        if watchdog:
+            watchdog.stop()
+        app.sampler.stop()
+        app.prober.shutdown()
+        app.launcher.shutdown()
         print("Application closed normally")
     except Exception as e:
         print(f"\n!!! ERROR !!!")
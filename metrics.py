@@ -0,0 +1,199 @@
+# ============================================================================
+# FILE: metrics.py
+# ============================================================================
+
+import heapq
+import itertools
+import os
+import shutil
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from scheduler import ResultQueue
+
+
+class Metric:
+    """A cheap live value shown as a badge on a module
+    
+    read() returns the badge text, or None when the value is not available
+    on this platform. It runs on the sampler thread every interval seconds.
+    """
+    
+    __slots__ = ("name", "interval", "read")
+    
+    def __init__(self, name: str, interval: float, read: Callable[[], Optional[str]]):
+        self.name = name
+        self.interval = interval
+        self.read = read
+
+
+# ============================================================================
+# SOURCES
+# ============================================================================
+def _format_bytes(count: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if count < 1024:
+            return f"{count:.0f} {unit}"
+        count /= 1024
+    return f"{count:.1f} TB"
+
+
+def _format_duration(seconds: float) -> str:
+    minutes = int(seconds // 60)
+    days, minutes = divmod(minutes, 24 * 60)
+    hours, minutes = divmod(minutes, 60)
+    if days:
+        return f"{days}d {hours}h"
+    return f"{hours}h {minutes}m"
+
+
+def disk_free(path: Optional[str] = None) -> Optional[str]:
+    """Free space on the system drive (or the drive holding path)"""
+    if path is None:
+        path = (os.environ.get("SystemDrive", "C:") + "\\") if os.name == "nt" else "/"
+    try:
+        return f"{_format_bytes(shutil.disk_usage(path).free)} free"
+    except OSError:
+        return None
+
+
+def network_links() -> Optional[str]:
+    """Number of network interfaces that are up (Linux: /sys/class/net)"""
+    base = "/sys/class/net"
+    try:
+        names = [name for name in os.listdir(base) if name != "lo"]
+    except OSError:
+        return None
+    up = 0
+    for name in names:
+        try:
+            with open(os.path.join(base, name, "operstate")) as f:
+                up += f.read().strip() == "up"
+        except OSError:
+            pass
+    return f"{up}/{len(names)} up"
+
+
+def uptime() -> Optional[str]:
+    """Time since boot (Linux: /proc/uptime, Windows: GetTickCount64)"""
+    try:
+        with open("/proc/uptime") as f:
+            seconds = float(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        if os.name != "nt":
+            return None
+        import ctypes
+        seconds = ctypes.windll.kernel32.GetTickCount64() / 1000
+    return f"up {_format_duration(seconds)}"
+
+
+def load_average() -> Optional[str]:
+    """One-minute load average (not available on Windows)"""
+    try:
+        return f"load {os.getloadavg()[0]:.2f}"
+    except (AttributeError, OSError):
+        return None
+
+
+# ============================================================================
+# SAMPLER
+# ============================================================================
+class MetricSampler:
+    """One background thread sampling the metrics of all modules
+    
+    Metrics are kept in a heap ordered by their next due time; every wakeup
+    reads all metrics that are due as one batch. Only values that changed
+    are put on a ResultQueue, which the Tk thread drains every
+    POLL_INTERVAL_MS, reporting a module's badge texts to on_change(key,
+    texts). While paused (e.g. the window is minimized) neither the thread
+    nor the poll does any work.
+    """
+    
+    POLL_INTERVAL_MS = 1000
+    BATCH_WINDOW = 0.25     # Metrics due this soon are read in the same batch
+    
+    def __init__(self, root):
+        self.root = root
+        self.on_change: Optional[Callable[[str, List[str]], None]] = None
+        self.metrics: Dict[str, List[Metric]] = {}
+        self.values: Dict[Tuple[str, str], str] = {}
+        self.results = ResultQueue(root, self._on_results)
+        self._due: List[Tuple[float, int, str, Metric]] = []
+        self._order = itertools.count()
+        self._wakeup = threading.Event()
+        self._running = threading.Event()
+        self._stopped = False
+        self._thread = None
+    
+    def add(self, key: str, metric: Metric):
+        """Sample metric for key (a module name); call before start()"""
+        self.metrics.setdefault(key, []).append(metric)
+        heapq.heappush(self._due, (0.0, next(self._order), key, metric))
+    
+    def start(self, on_change: Callable[[str, List[str]], None]):
+        if self._thread is not None or not self._due:
+            return
+        self.on_change = on_change
+        self._thread = threading.Thread(target=self._run, name="metrics", daemon=True)
+        self._thread.start()
+        self.resume()
+    
+    def pause(self):
+        """Stop sampling until resume()"""
+        self._running.clear()
+        self.results.stop()
+    
+    def resume(self):
+        if self._thread is None or self._stopped or self._running.is_set():
+            return
+        self._running.set()
+        self._wakeup.set()
+        self.results.poll_in(self.POLL_INTERVAL_MS)
+    
+    def stop(self):
+        self.pause()
+        self._stopped = True
+        self._running.set()
+        self._wakeup.set()
+    
+    def _run(self):
+        """Sampler thread: read the due metrics in batches"""
+        last = {}
+        while True:
+            self._running.wait()
+            if self._stopped:
+                return
+            
+            now = time.monotonic()
+            batch = []
+            while self._due and self._due[0][0] <= now + self.BATCH_WINDOW:
+                batch.append(heapq.heappop(self._due))
+            for _, order, key, metric in batch:
+                try:
+                    value = metric.read()
+                except Exception:
+                    value = None
+                if value != last.get((key, metric.name)):
+                    last[(key, metric.name)] = value
+                    self.results.put((key, metric.name, value))
+                heapq.heappush(self._due, (now + metric.interval, order, key, metric))
+            
+            self._wakeup.clear()
+            self._wakeup.wait(max(0.0, self._due[0][0] - time.monotonic()))
+    
+    def _on_results(self, results) -> Optional[int]:
+        """Tk thread: report the modules whose values changed"""
+        changed = set()
+        for key, name, value in results:
+            self.values[(key, name)] = value
+            changed.add(key)
+        
+        for key in changed:
+            texts = [self.values[(key, metric.name)] for metric in self.metrics[key]
+                     if self.values.get((key, metric.name))]
+            self.on_change(key, texts)
+        
+        if self._running.is_set() and not self._stopped:
+            return self.POLL_INTERVAL_MS
+        return None
@@ -1,10 +1,26 @@
 from modules.base_module     import *
-from modules.accounts        import *
-from modules.apps            import *
-from modules.devices         import *
-from modules.network         import *
-from modules.personalization import *
-from modules.security        import *
-from modules.services        import *
-from modules.storage         import *
-from modules.system          import *
\ No newline at end of file
+
+# Module classes are imported on first access so that importing the package
+# (e.g. for base_module) does not pull in every module. The application
+# itself discovers modules through plugin_registry.
+import importlib as _importlib
+
+_MODULE_CLASSES = {
+    "AccountsModule":        "modules.accounts",
+    "AppsModule":            "modules.apps",
+    "CatalogModule":         "modules.catalog_module",
+    "DevicesModule":         "modules.devices",
+    "FrequentModule":        "modules.frequent_module",
+    "NetworkModule":         "modules.network",
+    "PersonalizationModule": "modules.personalization",
+    "SecurityModule":        "modules.security",
+    "ServicesModule":        "modules.services",
+    "StorageModule":         "modules.storage",
+    "SystemModule":          "modules.system",
+}
+
+
+def __getattr__(name):
+    if name in _MODULE_CLASSES:
+        return getattr(_importlib.import_module(_MODULE_CLASSES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
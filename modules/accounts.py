@@ -16,7 +16,7 @@ class AccountsModule(BaseModule):
     def get_color(self) -> str:
         return "#f97316"
     
-    def get_settings(self) -> List[ModuleSetting]:
+    def build_settings(self) -> List[ModuleSetting]:
         return [
             ModuleSetting("User Accounts", "Manage user accounts", "netplwiz"),
             ModuleSetting("Sign-in Options", "Password, PIN, biometrics", "ms-settings:signinoptions"),
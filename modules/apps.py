@@ -16,7 +16,7 @@ class AppsModule(BaseModule):
     def get_color(self) -> str:
         return "#6366f1"
     
-    def get_settings(self) -> List[ModuleSetting]:
+    def build_settings(self) -> List[ModuleSetting]:
         return [
             ModuleSetting("Apps & Features", "Install/uninstall apps", "ms-settings:appsfeatures"),
             ModuleSetting("Default Apps", "Set default programs", "ms-settings:defaultapps"),
@@ -2,26 +2,64 @@
 # FILE: modules/base_module.py
 # ============================================================================
 
+import itertools
+import sys
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+
+from metrics import Metric
+
+_setting_ids = itertools.count()
 
 class ModuleSetting:
-    """Represents a single setting within a module"""
+    """Represents a single setting within a module (immutable)
+    
+    Every setting gets a unique integer id when it is created, usable as a
+    cache key for that setting object. Ids are not stable across rebuilds:
+    after invalidate_settings() a module's settings are new objects with new
+    ids, so never persist them. Strings are interned since catalogs repeat
+    many of them.
+    """
+    
+    __slots__ = ("id", "name", "description", "command")
     
     def __init__(self, name: str, description: str, command: str):
-        self.name = name
-        self.description = description
-        self.command = command
+        object.__setattr__(self, "id", next(_setting_ids))
+        object.__setattr__(self, "name", sys.intern(name))
+        object.__setattr__(self, "description", sys.intern(description))
+        object.__setattr__(self, "command", sys.intern(command))
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("ModuleSetting is immutable")
+    
+    def __delattr__(self, name):
+        raise AttributeError("ModuleSetting is immutable")
+    
+    def __repr__(self) -> str:
+        return f"ModuleSetting({self.name!r}, {self.description!r}, {self.command!r})"
 
 
 class BaseModule(ABC):
     """Base class for all control panel modules"""
     
+    # Whether the module's settings are added to the search index
+    searchable = True
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Modules written before build_settings existed override get_settings;
+        # use it as their build_settings so they keep working (and get cached)
+        if "get_settings" in cls.__dict__ and cls.build_settings is BaseModule.build_settings:
+            cls.build_settings = cls.__dict__["get_settings"]
+            cls.get_settings = BaseModule.get_settings
+    
     def __init__(self):
         self.name: str = ""
         self.icon: str = ""
         self.color: str = ""
         self.settings: List[ModuleSetting] = []
+        self.settings_version = 0
+        self._settings_cache = None
     
     @abstractmethod
     def get_name(self) -> str:
@@ -38,10 +76,28 @@ class BaseModule(ABC):
         """Return the module color"""
         pass
     
-    @abstractmethod
-    def get_settings(self) -> List[ModuleSetting]:
-        """Return list of settings for this module"""
-        pass
+    def build_settings(self) -> List[ModuleSetting]:
+        """Create the list of settings for this module (self.settings by default)"""
+        return list(self.settings)
+    
+    def get_settings(self) -> Tuple[ModuleSetting, ...]:
+        """Return the settings for this module (built once, then cached)"""
+        if self._settings_cache is None:
+            self._settings_cache = tuple(self.build_settings())
+        return self._settings_cache
+    
+    def get_metrics(self) -> List[Metric]:
+        """Return live metrics shown as badges on the module (none by default)"""
+        return []
+    
+    def get_setting_module(self, setting: ModuleSetting) -> "BaseModule":
+        """Return the module a setting belongs to (itself, unless it lists other modules' settings)"""
+        return self
+    
+    def invalidate_settings(self):
+        """Discard the cached settings; the next get_settings() rebuilds them"""
+        self._settings_cache = None
+        self.settings_version += 1
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert module to dictionary format"""
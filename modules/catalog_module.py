@@ -0,0 +1,34 @@
+# ============================================================================
+# FILE: modules/catalog_module.py
+# ============================================================================
+
+from .base_module import *
+
+class CatalogModule(BaseModule):
+    """Module whose settings come from a data catalog instead of code
+    
+    path and stamp ((mtime_ns, size)) identify the catalog file it was
+    loaded from, if any, so it can be reloaded when the file changes.
+    """
+    
+    def __init__(self, name: str, icon: str, color: str, settings: List[ModuleSetting],
+                 path: Optional[str] = None, stamp: Optional[Tuple[int, int]] = None):
+        super().__init__()
+        self.name = name
+        self.icon = icon
+        self.color = color
+        self.settings = settings
+        self.path = path
+        self.stamp = stamp
+    
+    def get_name(self) -> str:
+        return self.name
+    
+    def get_icon(self) -> str:
+        return self.icon
+    
+    def get_color(self) -> str:
+        return self.color
+    
+    def build_settings(self) -> List[ModuleSetting]:
+        return self.settings
@@ -16,7 +16,7 @@ class DevicesModule(BaseModule):
     def get_color(self) -> str:
         return "#8b5cf6"
     
-    def get_settings(self) -> List[ModuleSetting]:
+    def build_settings(self) -> List[ModuleSetting]:
         return [
             ModuleSetting("Bluetooth", "Manage Bluetooth devices", "ms-settings:bluetooth"),
             ModuleSetting("Printers", "Add and manage printers", "ms-settings:printers"),
@@ -0,0 +1,52 @@
+# ============================================================================
+# FILE: modules/frequent_module.py
+# ============================================================================
+
+from .base_module import *
+from theme import Theme
+
+class FrequentModule(BaseModule):
+    """Pseudo-module listing the most frecently launched settings of all modules
+    
+    Its settings are the original ModuleSetting objects of other modules, so
+    it is left out of the search index and reports the owning module through
+    get_setting_module(). Call invalidate_settings() after recording a launch
+    to rebuild the list on its next view.
+    """
+    
+    searchable = False
+    
+    def __init__(self, tracker, modules: Dict[str, BaseModule]):
+        super().__init__()
+        self.name = Theme.FREQUENT_MODULE_NAME
+        self.icon = Theme.FREQUENT_MODULE_ICON
+        self.color = Theme.ACCENT_ORANGE
+        self.tracker = tracker
+        self.modules = modules
+        self._owners: Dict[int, BaseModule] = {}
+    
+    def get_name(self) -> str:
+        return self.name
+    
+    def get_icon(self) -> str:
+        return self.icon
+    
+    def get_color(self) -> str:
+        return self.color
+    
+    def build_settings(self) -> List[ModuleSetting]:
+        self._owners = {}
+        settings = []
+        for module_name, setting_name in self.tracker.top(Theme.FREQUENT_MODULE_SIZE):
+            module = self.modules.get(module_name)
+            if module is None or module is self:
+                continue
+            for setting in module.get_settings():
+                if setting.name == setting_name:
+                    self._owners[setting.id] = module
+                    settings.append(setting)
+                    break
+        return settings
+    
+    def get_setting_module(self, setting: ModuleSetting) -> BaseModule:
+        return self._owners.get(setting.id, self)
@@ -3,6 +3,7 @@
 # ============================================================================
 
 from .base_module import *
+from metrics import network_links
 
 class NetworkModule(BaseModule):
     """Network settings module"""
@@ -16,7 +17,10 @@ class NetworkModule(BaseModule):
     def get_color(self) -> str:
         return "#10b981"
     
-    def get_settings(self) -> List[ModuleSetting]:
+    def get_metrics(self) -> List[Metric]:
+        return [Metric("links", 5, network_links)]
+    
+    def build_settings(self) -> List[ModuleSetting]:
         return [
             ModuleSetting("Network Connections", "View all network adapters", "ncpa.cpl"),
             ModuleSetting("Network Status", "Check connection status", "ms-settings:network-status"),
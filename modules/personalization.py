@@ -16,7 +16,7 @@ class PersonalizationModule(BaseModule):
     def get_color(self) -> str:
         return "#ec4899"
     
-    def get_settings(self) -> List[ModuleSetting]:
+    def build_settings(self) -> List[ModuleSetting]:
         return [
             ModuleSetting("Personalization", "Customize Windows", "ms-settings:personalization"),
             ModuleSetting("Background", "Change wallpaper", "ms-settings:personalization-background"),
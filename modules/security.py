@@ -16,7 +16,7 @@ class SecurityModule(BaseModule):
     def get_color(self) -> str:
         return "#ef4444"
     
-    def get_settings(self) -> List[ModuleSetting]:
+    def build_settings(self) -> List[ModuleSetting]:
         return [
             ModuleSetting("Windows Security", "Virus & threat protection", "windowsdefender:"),
             ModuleSetting("Windows Update", "Check for updates", "ms-settings:windowsupdate"),
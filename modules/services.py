@@ -17,7 +17,7 @@ class ServicesModule(BaseModule):
     def get_color(self) -> str:
         return "#14b8a6"
     
-    def get_settings(self) -> List[ModuleSetting]:
+    def build_settings(self) -> List[ModuleSetting]:
         return [
             ModuleSetting("Services", "Windows services", "services.msc"),
             ModuleSetting("Task Scheduler", "Scheduled tasks", "taskschd.msc"),
@@ -3,6 +3,7 @@
 # ============================================================================
 
 from .base_module import *
+from metrics import disk_free
 
 class StorageModule(BaseModule):
     """Storage management module"""
@@ -16,7 +17,10 @@ class StorageModule(BaseModule):
     def get_color(self) -> str:
         return "#0ea5e9"
     
-    def get_settings(self) -> List[ModuleSetting]:
+    def get_metrics(self) -> List[Metric]:
+        return [Metric("free", 30, disk_free)]
+    
+    def build_settings(self) -> List[ModuleSetting]:
         return [
             ModuleSetting("Disk Cleanup", "Free up disk space", "cleanmgr"),
             ModuleSetting("Disk Management", "Partition and format drives", "diskmgmt.msc"),
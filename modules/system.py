@@ -3,6 +3,7 @@
 # ============================================================================
 
 from .base_module import *
+from metrics import load_average, uptime
 
 class SystemModule(BaseModule):
     """System settings module"""
@@ -16,7 +17,10 @@ class SystemModule(BaseModule):
     def get_color(self) -> str:
         return "#3b82f6"
     
-    def get_settings(self) -> List[ModuleSetting]:
+    def get_metrics(self) -> List[Metric]:
+        return [Metric("uptime", 60, uptime), Metric("load", 10, load_average)]
+    
+    def build_settings(self) -> List[ModuleSetting]:
         return [
             ModuleSetting("System Information", "View detailed system specs", "msinfo32"),
             ModuleSetting("Display Settings", "Screen resolution and scaling", "desk.cpl"),
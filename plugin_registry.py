@@ -0,0 +1,156 @@
+# ============================================================================
+# FILE: plugin_registry.py
+# ============================================================================
+
+import importlib
+import importlib.util
+import json
+import os
+import sys
+import traceback
+from typing import Dict, List, Optional
+
+from app_paths import get_app_dir
+from catalog import load_catalogs
+from metrics import Metric
+from modules.base_module import BaseModule, ModuleSetting
+
+BUILTIN_MANIFEST = os.path.join(get_app_dir(), "modules", "manifest.json")
+
+
+class LazyModule(BaseModule):
+    """Stand-in for a module plugin that imports its code on first use
+    
+    The sidebar only needs the name, icon and color, which come from the
+    manifest. The plugin's code is imported the first time its settings
+    are requested.
+    """
+    
+    def __init__(self, name: str, icon: str, color: str, class_name: str,
+                 module_path: Optional[str] = None, file_path: Optional[str] = None,
+                 has_metrics: bool = False):
+        super().__init__()
+        self.name = name
+        self.icon = icon
+        self.color = color
+        self.class_name = class_name
+        self.module_path = module_path
+        self.file_path = file_path
+        self.has_metrics = has_metrics
+        self.module: Optional[BaseModule] = None
+    
+    def get_name(self) -> str:
+        return self.name
+    
+    def get_icon(self) -> str:
+        return self.icon
+    
+    def get_color(self) -> str:
+        return self.color
+    
+    def build_settings(self) -> List[ModuleSetting]:
+        module = self.load()
+        return list(module.get_settings()) if module is not None else []
+    
+    def get_metrics(self) -> List[Metric]:
+        # Only plugins whose manifest declares metrics are imported for them
+        if not self.has_metrics:
+            return []
+        module = self.load()
+        return module.get_metrics() if module is not None else []
+    
+    def invalidate_settings(self):
+        if self.module is not None:
+            self.module.invalidate_settings()
+        super().invalidate_settings()
+    
+    def is_loaded(self) -> bool:
+        return self.module is not None
+    
+    def load(self) -> Optional[BaseModule]:
+        """Import and instantiate the plugin (only the first call does work)"""
+        if self.module is None:
+            try:
+                self.module = self._import_class()()
+            except Exception as e:
+                print(f"Error loading module {self.name}: {e}", file=sys.stderr)
+                traceback.print_exc()
+                return None
+        return self.module
+    
+    def _import_class(self):
+        if self.file_path:
+            spec_name = f"ucp_plugin_{os.path.splitext(os.path.basename(self.file_path))[0]}"
+            spec = importlib.util.spec_from_file_location(spec_name, self.file_path)
+            code = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(code)
+        else:
+            code = importlib.import_module(self.module_path)
+        return getattr(code, self.class_name)
+
+
+def get_plugin_dirs() -> List[str]:
+    """Directories searched for plugin manifests (UCP_PLUGIN_PATH, os.pathsep separated)"""
+    return [d for d in os.environ.get("UCP_PLUGIN_PATH", "").split(os.pathsep) if d]
+
+
+def read_manifest(path: str) -> List[LazyModule]:
+    """Read a plugin manifest: a JSON list of module entries
+        
+        [{"name": "System", "icon": "💻", "color": "#3b82f6",
+          "module": "modules.system", "class": "SystemModule"}]
+    
+    Instead of an importable "module", an entry may give a "file" path to a
+    .py file, relative to the manifest. "metrics": true marks modules with
+    live metrics (see BaseModule.get_metrics).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    
+    base_dir = os.path.dirname(os.path.abspath(path))
+    modules = []
+    for entry in entries:
+        file_path = entry.get("file")
+        if file_path:
+            file_path = os.path.join(base_dir, file_path)
+        modules.append(LazyModule(
+            name=entry["name"],
+            icon=entry.get("icon", ""),
+            color=entry.get("color", ""),
+            class_name=entry["class"],
+            module_path=entry.get("module"),
+            file_path=file_path,
+            has_metrics=bool(entry.get("metrics"))
+        ))
+    return modules
+
+
+def discover_modules() -> Dict[str, BaseModule]:
+    """Discover all modules without importing any plugin code
+    
+    Built-in modules come first, in manifest order, followed by the plugins
+    of every *.json manifest in the plugin directories, and finally the
+    data-driven catalogs. A name that is already taken is skipped.
+    """
+    manifests = [BUILTIN_MANIFEST]
+    for directory in get_plugin_dirs():
+        if os.path.isdir(directory):
+            manifests.extend(os.path.join(directory, name)
+                             for name in sorted(os.listdir(directory))
+                             if name.endswith(".json"))
+    
+    found: List[BaseModule] = []
+    for manifest in manifests:
+        try:
+            found.extend(read_manifest(manifest))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Error reading plugin manifest {manifest}: {e}", file=sys.stderr)
+    found.extend(load_catalogs())
+    
+    modules = {}
+    for module in found:
+        if module.get_name() in modules:
+            print(f"Skipping module {module.get_name()}: name already in use", file=sys.stderr)
+            continue
+        modules[module.get_name()] = module
+    return modules
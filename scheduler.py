@@ -0,0 +1,163 @@
+# ============================================================================
+# FILE: scheduler.py
+# ============================================================================
+
+import heapq
+import itertools
+import queue
+import time
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+PRIORITY_HIGH = 0     # Visible work, e.g. streaming in the cards of the current view
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2      # Background work, e.g. building the search index
+
+
+class Task:
+    """A unit of cooperative work: a generator that yields between small steps"""
+    
+    def __init__(self, steps: Iterator, priority: int, on_done: Optional[Callable[[], None]]):
+        self.steps = steps
+        self.priority = priority
+        self.on_done = on_done
+        self.done = False
+        self.cancelled = False
+    
+    @property
+    def pending(self) -> bool:
+        return not (self.done or self.cancelled)
+    
+    def step(self) -> bool:
+        """Run one step; return False once the task has finished"""
+        try:
+            next(self.steps)
+            return True
+        except StopIteration:
+            self._finish()
+            return False
+    
+    def finish(self):
+        """Run the remaining steps right now (e.g. when the result is needed)"""
+        if not self.pending:
+            return
+        for _ in self.steps:
+            pass
+        self._finish()
+    
+    def cancel(self):
+        """Stop the task; its remaining steps never run"""
+        if self.pending:
+            self.cancelled = True
+            self.steps.close()
+    
+    def _finish(self):
+        self.done = True
+        if self.on_done:
+            self.on_done()
+
+
+class FrameScheduler:
+    """Runs tasks in time slices on the Tk event loop
+    
+    Each slice runs steps of the highest-priority pending tasks (oldest first
+    within a priority) until BUDGET_MS is used up, then yields to Tk so that
+    input and redraws are handled before the next slice.
+    """
+    
+    BUDGET_MS = 8
+    SLICE_INTERVAL_MS = 1
+    
+    def __init__(self, root, budget_ms: Optional[float] = None):
+        self.root = root
+        self.budget = (budget_ms if budget_ms is not None else self.BUDGET_MS) / 1000
+        self._queue: List[Tuple[int, int, Task]] = []
+        self._order = itertools.count()
+        self._slice_id = None
+    
+    def schedule(self, steps: Iterator, priority: int = PRIORITY_NORMAL,
+                 on_done: Optional[Callable[[], None]] = None) -> Task:
+        """Queue a generator to be run in slices; returns its Task handle"""
+        task = Task(steps, priority, on_done)
+        heapq.heappush(self._queue, (priority, next(self._order), task))
+        if self._slice_id is None:
+            self._slice_id = self.root.after_idle(self._run_slice)
+        return task
+    
+    def _run_slice(self):
+        self._slice_id = None
+        deadline = time.perf_counter() + self.budget
+        queue = self._queue
+        while queue and time.perf_counter() < deadline:
+            task = queue[0][2]
+            if not task.pending:
+                heapq.heappop(queue)
+                continue
+            try:
+                if not task.step():
+                    heapq.heappop(queue)
+            except Exception as e:
+                heapq.heappop(queue)
+                task.cancelled = True
+                print(f"Scheduled task failed: {e}")
+        
+        # Done and cancelled tasks are dropped lazily
+        while queue and not queue[0][2].pending:
+            heapq.heappop(queue)
+        if queue:
+            self._slice_id = self.root.after(self.SLICE_INTERVAL_MS, self._run_slice)
+    
+    def cancel_all(self):
+        """Cancel every queued task"""
+        for _, _, task in self._queue:
+            task.cancel()
+        self._queue = []
+        if self._slice_id is not None:
+            self.root.after_cancel(self._slice_id)
+            self._slice_id = None
+    
+    def __len__(self) -> int:
+        return sum(1 for _, _, task in self._queue if task.pending)
+
+
+class ResultQueue:
+    """Hands results from worker threads to the Tk thread
+    
+    Worker threads put() results. While polling, the Tk thread drains them
+    with after() and calls on_results(results) with everything that arrived
+    since the last poll (possibly nothing). on_results returns the delay in
+    ms until the next poll, or None to stop polling until poll_in().
+    """
+    
+    def __init__(self, root, on_results: Callable[[List[Any]], Optional[int]]):
+        self.root = root
+        self.on_results = on_results
+        self._queue = queue.Queue()
+        self._poll_id = None
+    
+    def put(self, result):
+        """Queue a result (safe to call from any thread)"""
+        self._queue.put(result)
+    
+    def poll_in(self, delay_ms: int):
+        """Poll after delay_ms, replacing the poll already scheduled"""
+        self.stop()
+        self._poll_id = self.root.after(delay_ms, self._poll)
+    
+    def stop(self):
+        """Stop polling; queued results wait for the next poll_in()"""
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+    
+    def _poll(self):
+        self._poll_id = None
+        results = []
+        while True:
+            try:
+                results.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        delay_ms = self.on_results(results)
+        # on_results may have scheduled a poll itself (e.g. a new launch)
+        if delay_ms is not None and self._poll_id is None:
+            self._poll_id = self.root.after(delay_ms, self._poll)
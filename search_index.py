@@ -0,0 +1,267 @@
+# ============================================================================
+# FILE: search_index.py
+# ============================================================================
+
+import heapq
+import re
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional, Set
+
+from modules.base_module import BaseModule, ModuleSetting
+
+_WORD_SEPARATORS = re.compile(r"[^0-9a-z]+")
+
+
+class SearchEntry:
+    """A single searchable setting with its pre-normalized fields"""
+    
+    __slots__ = ("id", "module", "setting", "name", "description", "command",
+                 "initials", "fields")
+    
+    def __init__(self, entry_id: int, module: BaseModule, setting: ModuleSetting):
+        self.id = entry_id
+        self.module = module
+        self.setting = setting
+        self.name = SearchIndex.normalize(setting.name)
+        self.description = SearchIndex.normalize(setting.description)
+        self.command = SearchIndex.normalize(setting.command)
+        self.initials = "".join(word[0] for word in SearchIndex.word_text(self.name).split())
+        
+        # (text, word-separated text, weight) for ranking
+        self.fields = (
+            (self.name, SearchIndex.word_text(self.name), SearchIndex.NAME_WEIGHT),
+            (self.description, SearchIndex.word_text(self.description), SearchIndex.DESCRIPTION_WEIGHT),
+            (self.command, SearchIndex.word_text(self.command), SearchIndex.COMMAND_WEIGHT),
+        )
+
+
+class SearchIndex:
+    """Inverted n-gram index over every setting of every module.
+    
+    Built once when the modules are loaded. Every character and every
+    NGRAM_SIZE-long substring (trigram) of each field is mapped to the ids
+    of the entries containing it, so a query only visits entries that
+    contain all of its characters or enough of its trigrams instead of the
+    whole catalog.
+    
+    Ranked searches cache every match of a query (before boost and limit)
+    in an LRU keyed by catalog version and normalized query. A query that
+    extends a cached one, as when typing, only rescores the cached matches
+    plus its own trigram (typo tolerant) hits.
+    """
+    
+    NGRAM_SIZE = 3
+    
+    # Ranking: match kind scores, scaled by the weight of the matched field
+    SCORE_EXACT = 100
+    SCORE_PREFIX = 90
+    SCORE_WORD_PREFIX = 75
+    SCORE_INITIALS = 70         # e.g. "dm" for "Device Manager"
+    SCORE_SUBSTRING = 60
+    SCORE_SUBSEQUENCE = 40      # Scaled by how tightly the characters cluster
+    SCORE_TRIGRAM = 30          # Scaled by the share of query trigrams found
+    MIN_TRIGRAM_SIMILARITY = 0.5
+    
+    NAME_WEIGHT = 1.0
+    DESCRIPTION_WEIGHT = 0.6
+    COMMAND_WEIGHT = 0.5
+    
+    RESULT_CACHE_SIZE = 64      # Queries whose matches are kept
+    
+    def __init__(self):
+        self.entries: List[SearchEntry] = []
+        self._postings: Dict[str, List[int]] = {}
+        self.version = 0        # Bumped whenever entries are added
+        self._results: "OrderedDict[tuple, List[tuple]]" = OrderedDict()
+    
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize text for matching (shared by queries and fields)"""
+        return text.lower().strip()
+    
+    @staticmethod
+    def word_text(text: str) -> str:
+        """Text with every run of non-alphanumerics turned into one space,
+        padded so ' ' + word marks a word boundary"""
+        return " " + _WORD_SEPARATORS.sub(" ", text)
+    
+    def build(self, modules: Dict[str, BaseModule]):
+        """(Re)build the index from all modules, in module order"""
+        for _ in self.build_steps(modules):
+            pass
+    
+    def build_steps(self, modules: Dict[str, BaseModule]) -> Iterator[None]:
+        """Build the index one setting at a time, yielding between settings
+        
+        Lets a FrameScheduler build the index in the background.
+        """
+        self.entries = []
+        self._postings = {}
+        self._results.clear()
+        for module in modules.values():
+            if not module.searchable:
+                continue
+            for setting in module.get_settings():
+                self.add(module, setting)
+                yield
+    
+    def add(self, module: BaseModule, setting: ModuleSetting) -> SearchEntry:
+        """Index a single setting"""
+        entry = SearchEntry(len(self.entries), module, setting)
+        self.entries.append(entry)
+        self.version += 1
+        
+        grams: Set[str] = set()
+        for field in (entry.name, entry.description, entry.command):
+            grams.update(self._ngrams(field))
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(entry.id)
+        
+        return entry
+    
+    def search_ranked(self, query: str, limit: Optional[int] = None,
+                      boost: Optional[Callable[[SearchEntry], float]] = None) -> List[SearchEntry]:
+        """Return the best matches for a query, best first
+        
+        Exact, prefix, word-prefix and substring matches rank above fuzzy
+        subsequence and trigram (typo tolerant) matches, and name matches
+        above description and command matches. Only the top limit entries
+        are selected, using a heap. An optional boost(entry) is added to the
+        score of every match, e.g. to favour frequently used settings.
+        """
+        query = self.normalize(query)
+        if not query:
+            return []
+        
+        key = (self.version, query)
+        scored = self._results.get(key)
+        if scored is None:
+            scored = self._match(query)
+            self._results[key] = scored
+            if len(self._results) > self.RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        else:
+            self._results.move_to_end(key)
+        
+        if boost is not None:
+            scored = [(score + boost(self.entries[-entry_id]), entry_id)
+                      for score, entry_id in scored]
+        
+        if limit is None:
+            best = sorted(scored, reverse=True)
+        else:
+            best = heapq.nlargest(limit, scored)
+        return [self.entries[-entry_id] for _, entry_id in best]
+    
+    def _match(self, query: str) -> List[tuple]:
+        """(score, -entry id) of every entry matching a normalized query"""
+        word_query = self.word_text(query)
+        trigram_hits = self._trigram_hits(query)
+        trigram_count = len(self._query_grams(query))
+        
+        min_hits = trigram_count * self.MIN_TRIGRAM_SIMILARITY
+        
+        narrowed = self._cached_prefix_matches(query)
+        if narrowed is None:
+            candidates = self._subsequence_candidates(query)
+        else:
+            # Any non-fuzzy match of the query also matches its prefix, so
+            # only the fuzzy matches can be new
+            candidates = {-entry_id for _, entry_id in narrowed}
+        candidates.update(entry_id for entry_id, hits in trigram_hits.items()
+                          if hits >= min_hits)
+        
+        scored = []
+        for entry_id in candidates:
+            entry = self.entries[entry_id]
+            score = self._score(entry, query, word_query)
+            if trigram_count and score < self.SCORE_TRIGRAM:
+                similarity = trigram_hits.get(entry_id, 0) / trigram_count
+                if similarity >= self.MIN_TRIGRAM_SIMILARITY:
+                    score = max(score, self.SCORE_TRIGRAM * similarity)
+            if score > 0:
+                # Ties keep catalog order
+                scored.append((score, -entry_id))
+        return scored
+    
+    def _cached_prefix_matches(self, query: str) -> Optional[List[tuple]]:
+        """Cached matches of the longest cached prefix of query, if any"""
+        for end in range(len(query) - 1, 0, -1):
+            scored = self._results.get((self.version, query[:end]))
+            if scored is not None:
+                return scored
+        return None
+    
+    def _score(self, entry: SearchEntry, query: str, word_query: str) -> float:
+        """Best weighted match score of a query across an entry's fields"""
+        best = 0.0
+        for text, words, weight in entry.fields:
+            if query not in text:
+                continue
+            if text == query:
+                score = self.SCORE_EXACT
+            elif text.startswith(query):
+                score = self.SCORE_PREFIX
+            elif word_query in words:
+                score = self.SCORE_WORD_PREFIX
+            else:
+                score = self.SCORE_SUBSTRING
+            best = max(best, score * weight)
+        
+        if (best < self.SCORE_INITIALS * self.NAME_WEIGHT and len(query) > 1
+                and entry.initials.startswith(query)):
+            best = self.SCORE_INITIALS * self.NAME_WEIGHT
+        
+        if best < self.SCORE_SUBSEQUENCE * self.NAME_WEIGHT:
+            tightness = self._subsequence_tightness(entry.name, query)
+            best = max(best, self.SCORE_SUBSEQUENCE * self.NAME_WEIGHT * tightness)
+        return best
+    
+    @staticmethod
+    def _subsequence_tightness(text: str, query: str) -> float:
+        """len(query) / length of the span matching query as a subsequence
+        of text (1.0 = contiguous), or 0.0 if it is not a subsequence"""
+        start = pos = -1
+        for char in query:
+            pos = text.find(char, pos + 1)
+            if pos < 0:
+                return 0.0
+            if start < 0:
+                start = pos
+        return len(query) / (pos - start + 1)
+    
+    def _subsequence_candidates(self, query: str) -> Set[int]:
+        """Entries containing every character of the query"""
+        postings = []
+        for char in set(query):
+            posting = self._postings.get(char)
+            if posting is None:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+        return candidates
+    
+    def _trigram_hits(self, query: str) -> Counter:
+        """Number of the query's trigrams contained in each entry"""
+        hits = Counter()
+        for gram in self._query_grams(query):
+            hits.update(self._postings.get(gram, ()))
+        return hits
+    
+    def _ngrams(self, text: str) -> Set[str]:
+        """The characters and NGRAM_SIZE-long substrings of text"""
+        grams = set(text)
+        grams.update(self._query_grams(text))
+        return grams
+    
+    def _query_grams(self, query: str) -> Set[str]:
+        """The NGRAM_SIZE-long substrings of a query"""
+        size = self.NGRAM_SIZE
+        return {query[i:i + size] for i in range(len(query) - size + 1)}
+    
+    def __len__(self) -> int:
+        return len(self.entries)
@@ -0,0 +1,101 @@
+# ============================================================================
+# FILE: session_state.py
+# ============================================================================
+
+import json
+import math
+import os
+import re
+from typing import Any, Callable, Dict, Optional
+
+from app_paths import get_data_dir, write_atomic
+
+_GEOMETRY = re.compile(r"^\d+x\d+([+-]-?\d+[+-]-?\d+)?$")
+
+
+def _is_number(value) -> bool:
+    return (isinstance(value, (int, float)) and not isinstance(value, bool)
+            and math.isfinite(value))
+
+
+# Check for every saved field; fields failing it (or unknown ones) are ignored
+FIELDS: Dict[str, Callable[[Any], bool]] = {
+    "zoom_level": _is_number,
+    "scroll_position": lambda value: _is_number(value) and 0.0 <= value <= 1.0,
+    "active_module": lambda value: isinstance(value, str),
+    "geometry": lambda value: isinstance(value, str) and bool(_GEOMETRY.match(value)),
+    "window_state": lambda value: isinstance(value, str),
+}
+
+
+class SessionState:
+    """Small persisted key/value store for session state (zoom, view, window)
+    
+    Updates are collected in memory and written together once no further
+    update arrived for SAVE_DELAY_MS. Writes go to a temporary file that is
+    then renamed over the state file, so a crash never leaves a torn file.
+    """
+    
+    SAVE_DELAY_MS = 1000
+    FILE_NAME = "session.json"
+    VERSION = 1
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(get_data_dir(), self.FILE_NAME)
+        self.data: Dict[str, Any] = {}
+        self.root = None
+        self._save_id = None
+    
+    def load(self) -> "SessionState":
+        """Read the saved state; a missing or unreadable file gives an empty state
+        
+        Fields with a value of the wrong type or format are dropped, so a
+        hand-edited or corrupt file cannot break startup.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            state = data.get("state")
+            if isinstance(state, dict):
+                self.data = {key: value for key, value in state.items()
+                             if key in FIELDS and FIELDS[key](value)}
+        return self
+    
+    def attach(self, root):
+        """Use root.after to schedule the debounced writes"""
+        self.root = root
+    
+    def get(self, key: str, default=None):
+        return self.data.get(key, default)
+    
+    def update(self, **values):
+        """Change some fields and schedule a save"""
+        changed = False
+        for key, value in values.items():
+            if self.data.get(key) != value:
+                self.data[key] = value
+                changed = True
+        if changed:
+            self._schedule_save()
+    
+    def _schedule_save(self):
+        if self.root is None:
+            return
+        if self._save_id is not None:
+            self.root.after_cancel(self._save_id)
+        self._save_id = self.root.after(self.SAVE_DELAY_MS, self.save)
+    
+    def save(self):
+        """Write the state now (atomically)"""
+        if self._save_id is not None:
+            self.root.after_cancel(self._save_id)
+            self._save_id = None
+        
+        data = {"version": self.VERSION, "state": self.data}
+        try:
+            write_atomic(self.path, lambda f: json.dump(data, f, indent=2))
+        except OSError as e:
+            print(f"Could not save session state to {self.path}: {e}")
@@ -0,0 +1,41 @@
+import json
+import os
+import tempfile
+import unittest
+
+from availability import AVAILABLE, UNAVAILABLE, AvailabilityProber
+
+
+class AvailabilityProberTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "availability.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_cache(self, entries):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"version": AvailabilityProber.VERSION, "entries": entries}, f)
+
+    def test_load_cache_uses_cached_results(self):
+        self.write_cache({"missing": [UNAVAILABLE, None, None],
+                          "present": [AVAILABLE, "/bin/present", 1],
+                          "broken": "x"})
+        prober = AvailabilityProber(None, cache_path=self.path)
+        prober.load_cache()
+        self.assertFalse(prober.is_available("missing"))
+        self.assertTrue(prober.is_available("present"))
+        self.assertTrue(prober.is_available("broken"))
+        self.assertNotIn("broken", prober.status)
+
+    def test_load_cache_ignores_malformed_entries(self):
+        self.write_cache([])
+        prober = AvailabilityProber(None, cache_path=self.path)
+        prober.load_cache()
+        self.assertEqual(prober.status, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from modules.base_module import BaseModule, ModuleSetting
+
+
+class _Named(BaseModule):
+    def get_name(self):
+        return "Test"
+
+    def get_icon(self):
+        return ""
+
+    def get_color(self):
+        return ""
+
+
+class LegacyModule(_Named):
+    """Written against the old API: overrides get_settings"""
+
+    def get_settings(self):
+        return [ModuleSetting("Legacy", "Old style module", "legacy.exe")]
+
+
+class BuiltModule(_Named):
+    def build_settings(self):
+        return [ModuleSetting("Built", "New style module", "built.exe")]
+
+
+class BaseModuleTest(unittest.TestCase):
+
+    def test_module_overriding_get_settings_can_be_created(self):
+        module = LegacyModule()
+        self.assertEqual([s.name for s in module.get_settings()], ["Legacy"])
+        self.assertIs(module.get_settings(), module.get_settings())
+
+    def test_settings_are_rebuilt_after_invalidate(self):
+        module = BuiltModule()
+        settings = module.get_settings()
+        module.invalidate_settings()
+        self.assertIsNot(module.get_settings(), settings)
+        self.assertEqual(module.settings_version, 1)
+
+    def test_default_build_settings_uses_settings_list(self):
+        module = _Named()
+        module.settings = [ModuleSetting("Listed", "From self.settings", "listed.exe")]
+        self.assertEqual([s.name for s in module.get_settings()], ["Listed"])
+
+
+if __name__ == "__main__":
+    unittest.main()
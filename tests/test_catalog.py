@@ -0,0 +1,59 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from catalog import load_catalogs, reload_catalog_module
+
+
+class CatalogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.catalogs = os.path.join(self.directory.name, "catalogs")
+        os.mkdir(self.catalogs)
+        environ = mock.patch.dict(os.environ, {"UCP_DATA_DIR": os.path.join(self.directory.name, "data")})
+        environ.start()
+        self.addCleanup(environ.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, file_name, data):
+        path = os.path.join(self.catalogs, file_name)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        return path
+
+    def test_file_with_invalid_field_is_skipped(self):
+        self.write("bad.json", {"name": "Bad", "items": [{"name": "X", "desc": None, "cmd": "x"}]})
+        self.write("good.json", {"name": "Good", "items": [{"name": "Y", "cmd": "y"}]})
+        self.assertEqual([m.get_name() for m in load_catalogs([self.catalogs])], ["Good"])
+
+    def test_changed_file_is_reloaded(self):
+        path = self.write("tools.json", {"name": "Tools", "items": [{"name": "A", "cmd": "a"}]})
+        module, = load_catalogs([self.catalogs])
+        self.assertEqual([s.name for s in module.get_settings()], ["A"])
+        self.assertFalse(reload_catalog_module(module))
+
+        self.write("tools.json", {"name": "Tools", "items": [{"name": "A", "cmd": "a"},
+                                                            {"name": "B", "cmd": "b"}]})
+        os.utime(path, ns=(0, module.stamp[0] + 1))
+        self.assertTrue(reload_catalog_module(module))
+        module.invalidate_settings()
+        self.assertEqual([s.name for s in module.get_settings()], ["A", "B"])
+
+    def test_broken_edit_keeps_old_settings(self):
+        path = self.write("tools.json", {"name": "Tools", "items": [{"name": "A", "cmd": "a"}]})
+        module, = load_catalogs([self.catalogs])
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("{not json")
+        os.utime(path, ns=(0, module.stamp[0] + 1))
+        with mock.patch("sys.stderr"):
+            self.assertFalse(reload_catalog_module(module))
+        self.assertEqual([s.name for s in module.settings], ["A"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import unittest
+from unittest import mock
+
+from launcher import CommandCompiler, LaunchPlan, ERROR_ELEVATION_REQUIRED
+
+
+def fake_which(known):
+    """which() stand-in that only finds the programs in known"""
+    return lambda program: known.get(program)
+
+
+class CommandCompilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.compiler = CommandCompiler(
+            scheme_handlers={
+                "shell": lambda c, command: c.exec_plan(command, ["files", command]),
+                "*": lambda c, command: LaunchPlan(LaunchPlan.OPEN, command),
+            },
+            extension_handlers={
+                ".msc": lambda c, command, argv: c.exec_plan(command, ["mmc"] + argv),
+            },
+            which=fake_which({
+                "mmc": "/usr/bin/mmc",
+                "files": "/usr/bin/files",
+                "regedit": "/usr/bin/regedit",
+            })
+        )
+
+    def test_resolved_program_is_executed_directly(self):
+        plan = self.compiler.compile("regedit /s")
+        self.assertEqual(plan.kind, LaunchPlan.EXEC)
+        self.assertEqual(plan.argv, ["/usr/bin/regedit", "/s"])
+
+    def test_unresolved_program_falls_back_to_the_shell(self):
+        plan = self.compiler.compile("msinfo32")
+        self.assertEqual(plan.kind, LaunchPlan.SHELL)
+        self.assertEqual(plan.command, "msinfo32")
+
+    def test_extension_handler(self):
+        plan = self.compiler.compile("devmgmt.msc")
+        self.assertEqual(plan.kind, LaunchPlan.EXEC)
+        self.assertEqual(plan.argv, ["/usr/bin/mmc", "devmgmt.msc"])
+
+    def test_scheme_handlers(self):
+        self.assertEqual(self.compiler.compile("shell:Downloads").argv,
+                         ["/usr/bin/files", "shell:Downloads"])
+        plan = self.compiler.compile("ms-settings:display")
+        self.assertEqual(plan.kind, LaunchPlan.OPEN)
+        self.assertEqual(plan.command, "ms-settings:display")
+
+    def test_plans_and_lookups_are_cached(self):
+        which = mock.Mock(return_value="/usr/bin/regedit")
+        compiler = CommandCompiler({}, {}, which=which)
+        self.assertIs(compiler.compile("regedit"), compiler.compile("regedit"))
+        compiler.compile("regedit /s")
+        which.assert_called_once_with("regedit")
+
+
+class LaunchPlanTest(unittest.TestCase):
+
+    def test_elevation_required_retries_through_shell_execute(self):
+        error = OSError("The requested operation requires elevation")
+        error.winerror = ERROR_ELEVATION_REQUIRED
+        plan = LaunchPlan(LaunchPlan.EXEC, "mmc services.msc",
+                          ["C:\\Windows\\System32\\mmc.exe", "services.msc"])
+        with mock.patch("subprocess.Popen", side_effect=error), \
+                mock.patch.object(os, "startfile", create=True) as startfile:
+            self.assertIsNone(plan.spawn())
+        startfile.assert_called_once_with("C:\\Windows\\System32\\mmc.exe",
+                                          arguments="services.msc")
+
+    def test_other_errors_are_raised(self):
+        plan = LaunchPlan(LaunchPlan.EXEC, "missing", ["/nonexistent/missing"])
+        with self.assertRaises(OSError):
+            plan.spawn()
+
+
+if __name__ == "__main__":
+    unittest.main()
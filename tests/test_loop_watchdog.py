@@ -0,0 +1,24 @@
+import os
+import unittest
+from unittest import mock
+
+from loop_watchdog import _threshold_from_environment
+
+
+class ThresholdFromEnvironmentTest(unittest.TestCase):
+
+    def threshold(self, value):
+        with mock.patch.dict(os.environ, {"UCP_WATCHDOG_THRESHOLD_MS": value}), \
+                mock.patch("sys.stderr"):
+            return _threshold_from_environment()
+
+    def test_valid_threshold(self):
+        self.assertEqual(self.threshold("400"), 400)
+
+    def test_invalid_threshold_falls_back_to_the_default(self):
+        for value in ("", "fast", "1.5", "0", "-100"):
+            self.assertIsNone(self.threshold(value), value)
+
+
+if __name__ == "__main__":
+    unittest.main()
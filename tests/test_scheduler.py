@@ -0,0 +1,77 @@
+import unittest
+
+from scheduler import ResultQueue
+
+
+class FakeRoot:
+    """Stand-in for Tk's after/after_cancel; run() fires the due callbacks"""
+
+    def __init__(self):
+        self.pending = {}
+        self._next_id = 0
+
+    def after(self, delay_ms, callback, *args):
+        self._next_id += 1
+        self.pending[self._next_id] = (delay_ms, callback, args)
+        return self._next_id
+
+    def after_cancel(self, after_id):
+        self.pending.pop(after_id, None)
+
+    def delays(self):
+        return sorted(delay for delay, _, _ in self.pending.values())
+
+    def run(self):
+        calls, self.pending = list(self.pending.values()), {}
+        for _, callback, args in calls:
+            callback(*args)
+
+
+class ResultQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = FakeRoot()
+        self.batches = []
+        self.next_delay = 50
+        self.results = ResultQueue(self.root, self.on_results)
+
+    def on_results(self, results):
+        self.batches.append(results)
+        return self.next_delay
+
+    def test_results_are_delivered_in_batches(self):
+        self.results.put(1)
+        self.results.put(2)
+        self.results.poll_in(100)
+        self.assertEqual(self.root.delays(), [100])
+        self.root.run()
+        self.assertEqual(self.batches, [[1, 2]])
+        self.assertEqual(self.root.delays(), [50])
+        self.root.run()
+        self.assertEqual(self.batches, [[1, 2], []])
+
+    def test_returning_none_stops_polling(self):
+        self.next_delay = None
+        self.results.poll_in(100)
+        self.root.run()
+        self.assertEqual(self.root.delays(), [])
+
+    def test_poll_in_replaces_the_scheduled_poll(self):
+        self.results.poll_in(1000)
+        self.results.poll_in(50)
+        self.assertEqual(self.root.delays(), [50])
+        self.results.stop()
+        self.assertEqual(self.root.delays(), [])
+
+    def test_poll_scheduled_by_on_results_is_kept(self):
+        def on_results(results):
+            self.results.poll_in(10)
+            return 1000
+        self.results.on_results = on_results
+        self.results.poll_in(100)
+        self.root.run()
+        self.assertEqual(self.root.delays(), [10])
+
+
+if __name__ == "__main__":
+    unittest.main()
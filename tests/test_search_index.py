@@ -0,0 +1,45 @@
+import unittest
+
+from benchmark import make_catalog
+from search_index import SearchIndex
+
+QUERIES = ["d", "de", "dev", "devi", "device", "dm", "disk m", "netwrk", "firewal", "xq", "cpl"]
+
+
+class SearchIndexTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.modules = make_catalog(500)
+
+    def make_index(self):
+        index = SearchIndex()
+        index.build(self.modules)
+        return index
+
+    def ranked(self, index, query):
+        return [entry.id for entry in index.search_ranked(query)]
+
+    def test_narrowed_results_match_a_cold_search(self):
+        typing = self.make_index()
+        for query in QUERIES:
+            for end in range(1, len(query) + 1):
+                prefix = query[:end]
+                # Typing fills the result cache one keystroke at a time
+                narrowed = self.ranked(typing, prefix)
+                cold = self.ranked(self.make_index(), prefix)
+                self.assertEqual(narrowed, cold, prefix)
+
+    def test_boost_and_limit_apply_to_cached_matches(self):
+        index = self.make_index()
+        boost = lambda entry: entry.id % 7
+        first = [e.id for e in index.search_ranked("dev", limit=5, boost=boost)]
+        again = [e.id for e in index.search_ranked("dev", limit=5, boost=boost)]
+        cold = [e.id for e in self.make_index().search_ranked("dev", limit=5, boost=boost)]
+        self.assertEqual(first, again)
+        self.assertEqual(first, cold)
+        self.assertLessEqual(len(first), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
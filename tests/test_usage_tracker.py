@@ -0,0 +1,53 @@
+import json
+import os
+import tempfile
+import unittest
+
+from usage_tracker import UsageTracker
+
+
+class UsageTrackerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "usage.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_flush_round_trip(self):
+        tracker = UsageTracker(self.path)
+        tracker.record("System", "Device Manager", now=1000.0)
+        tracker.flush()
+        self.assertFalse(tracker._dirty)
+        loaded = UsageTracker(self.path).load()
+        self.assertAlmostEqual(loaded.frecency("System", "Device Manager", now=1000.0), 1.0)
+
+    def test_load_skips_malformed_entries(self):
+        version = UsageTracker.VERSION
+        cases = [
+            ({"version": version, "entries": {"a": [1], "b/c": [2.0, 1000]}}, {"b/c"}),
+            ({"version": version, "entries": {"a": ["x", 2], "b/c": [2.0, 1000]}}, {"b/c"}),
+            ({"version": version, "entries": []}, set()),
+            (["x", 2], set()),
+        ]
+        for data, expected in cases:
+            with open(self.path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            self.assertEqual(set(UsageTracker(self.path).load().entries), expected, data)
+
+    def test_failed_flush_keeps_launches_unsaved(self):
+        tracker = UsageTracker(os.path.join(self.path, "missing", "usage.json"))
+        tracker.record("System", "Device Manager")
+        tracker.flush()
+        self.assertTrue(tracker._dirty)
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+        tracker.path = self.path
+        tracker.flush()
+        self.assertFalse(tracker._dirty)
+        self.assertEqual(os.listdir(self.directory.name), ["usage.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()
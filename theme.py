@@ -23,6 +23,7 @@ class Theme:
     
     TEXT_PRIMARY = "#ffffff"
     TEXT_SECONDARY = "#888888"
+    TEXT_DISABLED = "#555555"
     
     ACCENT_BLUE = "#0078d4"
     ACCENT_GREEN = "#10b981"
@@ -81,6 +82,23 @@ class Theme:
     CONTENT_NO_RESULTS_PADDING_Y = 50
     CONTENT_CARD_PADDING_Y = 5
     
+    # Result lists longer than this are rendered as a virtualized list
+    VIRTUAL_LIST_THRESHOLD = 100
+    VIRTUAL_OVERSCAN_ROWS = 3
+    
+    # Cards built right away when a view is shown; the rest are streamed in
+    FIRST_PAINT_CARDS = 12
+    
+    # How setting cards are rendered: "widgets" (a SettingCard per card) or
+    # "canvas" (drawn on the content canvas, no widgets per card)
+    CARD_RENDERER = "widgets"
+    
+    # Settings whose command is missing on this host: "dim" or "hide"
+    UNAVAILABLE_SETTINGS = "dim"
+    
+    # Number of built module views kept alive for instant switching
+    VIEW_CACHE_SIZE = 5
+    
     # Setting cards
     CARD_PADDING_X = 20
     CARD_PADDING_Y = 15
@@ -92,12 +110,15 @@ class Theme:
     SEARCH_BAR_PADDING_X = 15
     SEARCH_BAR_PADDING_Y = 10
     SEARCH_BAR_BORDER_RADIUS = 20
+    SEARCH_DEBOUNCE_MS = 150  # Quiet time after the last keystroke before searching
+    SEARCH_RESULT_LIMIT = 20  # Best matches shown per query
     
     # Modern buttons
     BUTTON_PADDING_X = 20
     BUTTON_PADDING_Y = 8
     BUTTON_BORDER_WIDTH = 0
     BUTTON_CURSOR = "hand2"
+    BUSY_CURSOR = "watch"
     
     # ========================================================================
     # TEXT CONTENT
@@ -107,12 +128,23 @@ class Theme:
     SIDEBAR_TITLE = "CATEGORIES"
     SEARCH_PLACEHOLDER = "Search settings..."
     NO_RESULTS_MESSAGE = "No settings found matching your search"
+    CARD_ARROW = "→"
+    CARD_BUSY_INDICATOR = "⏳"
+    FREQUENT_MODULE_NAME = "Frequently used"
+    FREQUENT_MODULE_ICON = "⭐"
+    FREQUENT_MODULE_SIZE = 12  # Settings shown in the quick-launch list
     
     @staticmethod
     def settings_count_text(count: int) -> str:
         """Generate settings count text"""
         return f"{count} settings available"
     
+    @staticmethod
+    def module_subtitle_text(count: int, badge: str = "") -> str:
+        """Generate module header subtitle text, with the live status if any"""
+        text = Theme.settings_count_text(count)
+        return f"{text}  ·  {badge}" if badge else text
+    
     @staticmethod
     def search_results_text(query: str) -> str:
         """Generate search results header text"""
@@ -0,0 +1,98 @@
+# ============================================================================
+# FILE: tracing.py
+# ============================================================================
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+class Tracer:
+    """Lightweight span tracer exporting Chrome trace-event JSON
+    
+    Disabled tracers record nothing. The exported file can be opened in
+    chrome://tracing or https://ui.perfetto.dev.
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self.output_path: Optional[str] = None
+        self.events: List[Dict] = []
+        self._origin = time.perf_counter()
+    
+    def enable(self, output_path: Optional[str] = None):
+        """Start recording; output_path is where write() saves the trace"""
+        self.enabled = True
+        self.output_path = output_path
+    
+    @contextmanager
+    def span(self, name: str, **args):
+        """Record the duration of the with-block as a complete event"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_event(name, start, time.perf_counter(), args)
+    
+    def add_event(self, name: str, start: float, end: float, args: Optional[Dict] = None):
+        """Record a span from perf_counter() timestamps"""
+        if not self.enabled:
+            return
+        event = {
+            "name": name,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": (end - start) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+    
+    def summary(self) -> str:
+        """One-line summary of the recorded spans, in recording order"""
+        if not self.events:
+            return "Trace: no spans recorded"
+        end = max(e["ts"] + e["dur"] for e in self.events)
+        spans = " | ".join(f"{e['name']} {e['dur'] / 1000:.1f}" for e in
+                           sorted(self.events, key=lambda e: e["ts"]))
+        return f"Trace: {end / 1000:.1f} ms total - {spans} (ms)"
+    
+    def write(self, path: Optional[str] = None) -> Optional[str]:
+        """Write the recorded events as a Chrome trace file; returns its path"""
+        path = path or self.output_path
+        if not self.enabled or not path:
+            return None
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+        return path
+
+
+# Shared tracer for the application
+tracer = Tracer()
+
+
+def enable_from_environment(argv: Optional[List[str]] = None) -> bool:
+    """Enable the shared tracer from --trace[=PATH] or the UCP_TRACE variable
+    
+    UCP_TRACE holds the output path ("1" uses the default file name).
+    """
+    path = os.environ.get("UCP_TRACE")
+    for arg in argv or ():
+        if arg == "--trace":
+            path = path or "1"
+        elif arg.startswith("--trace="):
+            path = arg.split("=", 1)[1]
+    if not path:
+        return False
+    if path == "1":
+        path = "ucp_trace.json"
+    tracer.enable(path)
+    return True
@@ -1,2 +1,2 @@
 rem no third party libraries used, no need for pip install
-python main.py
+python ucp.py %*
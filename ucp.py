@@ -0,0 +1,124 @@
+# ============================================================================
+# FILE: ucp.py
+# ============================================================================
+#
+# Command-line entry point. List, search and launch settings without
+# starting (or even importing) Tk; without one of these options the
+# graphical panel is started as usual.
+#
+#   ucp --list [--module System]
+#   ucp --search "device" [--limit 5] [--json]
+#   ucp --run "Device Manager"
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from launcher import CommandCompiler
+from plugin_registry import discover_modules
+from search_index import SearchIndex
+from theme import Theme
+
+
+def setting_dict(module_name: str, setting) -> dict:
+    return {
+        "module": module_name,
+        "name": setting.name,
+        "description": setting.description,
+        "command": setting.command,
+    }
+
+
+def print_settings(items: List[dict], as_json: bool):
+    if as_json:
+        print(json.dumps(items, indent=2, ensure_ascii=False))
+        return
+    for item in items:
+        print(f"{item['module']:<16} {item['name']:<28} {item['description']} ({item['command']})")
+
+
+def list_settings(modules, module_name: Optional[str], as_json: bool) -> int:
+    if module_name is not None and module_name not in modules:
+        print(f"Unknown module: {module_name}", file=sys.stderr)
+        return 1
+    names = [module_name] if module_name is not None else list(modules)
+    items = [setting_dict(name, setting)
+             for name in names
+             for setting in modules[name].get_settings()]
+    print_settings(items, as_json)
+    return 0
+
+
+def search_settings(modules, query: str, limit: int, as_json: bool) -> int:
+    index = SearchIndex()
+    index.build(modules)
+    items = [setting_dict(entry.module.get_name(), entry.setting)
+             for entry in index.search_ranked(query, limit=limit)]
+    print_settings(items, as_json)
+    return 0 if items else 1
+
+
+def run_setting(modules, name: str, as_json: bool) -> int:
+    """Launch the setting with the given name (case-insensitive)"""
+    wanted = name.strip().lower()
+    for module_name, module in modules.items():
+        for setting in module.get_settings():
+            if setting.name.lower() == wanted:
+                return launch(module_name, setting, as_json)
+    
+    index = SearchIndex()
+    index.build(modules)
+    suggestions = [entry.setting.name for entry in index.search_ranked(name, limit=5)]
+    print(f"No setting named \"{name}\"", file=sys.stderr)
+    if suggestions:
+        print(f"Did you mean: {', '.join(suggestions)}", file=sys.stderr)
+    return 1
+
+
+def launch(module_name: str, setting, as_json: bool) -> int:
+    result = setting_dict(module_name, setting)
+    try:
+        CommandCompiler().compile(setting.command).spawn()
+    except Exception as e:
+        result["error"] = str(e)
+    if as_json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    elif "error" in result:
+        print(f"Error executing {setting.name}: {result['error']}", file=sys.stderr)
+    else:
+        print(f"Started {setting.name}")
+    return 1 if "error" in result else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    parser = argparse.ArgumentParser(prog="ucp", description=Theme.WINDOW_TITLE)
+    actions = parser.add_mutually_exclusive_group()
+    actions.add_argument("--list", action="store_true", help="list settings")
+    actions.add_argument("--search", metavar="QUERY", help="search settings")
+    actions.add_argument("--run", metavar="NAME", help="launch a setting by name")
+    parser.add_argument("--module", help="only list this module")
+    parser.add_argument("--limit", type=int, default=Theme.SEARCH_RESULT_LIMIT,
+                        help="maximum number of search results")
+    parser.add_argument("--json", action="store_true", help="print JSON")
+    args, gui_args = parser.parse_known_args(argv)
+    
+    if not (args.list or args.search is not None or args.run is not None):
+        # No command-line action: start the panel (GUI-only options such as
+        # --trace are left in sys.argv for it)
+        import main as gui
+        sys.argv = [sys.argv[0]] + gui_args
+        gui.main()
+        return 0
+    
+    modules = discover_modules()
+    if args.list:
+        return list_settings(modules, args.module, args.json)
+    if args.search is not None:
+        return search_settings(modules, args.search, args.limit, args.json)
+    return run_setting(modules, args.run, args.json)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
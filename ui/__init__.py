@@ -1,3 +1,5 @@
+from ui.canvas_card_list  import CanvasCardList
+from ui.card_pool         import CardPool
 from ui.modern_button     import ModernButton
 from ui.scrollable_frame  import ScrollableFrame
 from ui.search_bar        import SearchBar
@@ -0,0 +1,224 @@
+import tkinter as tk
+import tkinter.font as tkfont
+from typing import Callable, Dict, List, Optional
+from theme import Theme
+
+
+class _CardSlot:
+    """Canvas items drawing one card; rebound to other cards while scrolling"""
+    
+    __slots__ = ("rect", "name", "desc", "arrow", "index", "data")
+    
+    def __init__(self, rect, name, desc, arrow):
+        self.rect = rect
+        self.name = name
+        self.desc = desc
+        self.arrow = arrow
+        self.index = -1
+        self.data = None
+
+
+class CanvasCardList:
+    """Setting cards drawn as items on a canvas instead of widget trees
+    
+    A card is four canvas items (background, name, description, arrow)
+    rather than three frames and three labels. Only the cards intersecting
+    the viewport are drawn, reusing the items of cards that scrolled away.
+    Clicks and hover are hit-tested from the pointer position, so hovering
+    recolors a single rectangle. Used as the canvas content of a
+    ScrollableFrame (see ScrollableFrame.set_canvas_content).
+    """
+    
+    ARROW_FONT = ("Segoe UI", 16)
+    
+    def __init__(self, canvas: tk.Canvas, name_font=None, desc_font=None):
+        self.canvas = canvas
+        self.name_font = name_font or tkfont.Font(font=Theme.FONT_CARD_NAME)
+        self.desc_font = desc_font or tkfont.Font(font=Theme.FONT_CARD_DESCRIPTION)
+        self.tag = f"cards{id(self)}"
+        
+        self.count = 0
+        self.get_card_data: Optional[Callable[[int], Dict]] = None
+        
+        self._top = 0
+        self._width = 0
+        self._row_height = 0
+        self._name_height = 0
+        self._row_spacing = 2 * Theme.CONTENT_CARD_PADDING_Y
+        self._slots: Dict[int, _CardSlot] = {}   # index -> slot drawn for it
+        self._free: List[_CardSlot] = []
+        self._hover: Optional[_CardSlot] = None
+    
+    def set_cards(self, count: int, get_card_data: Callable[[int], Dict]):
+        """Show count cards; get_card_data(index) returns SettingCard-style data"""
+        self.clear()
+        self.count = count
+        self.get_card_data = get_card_data
+    
+    def clear(self):
+        """Remove all cards, keeping their canvas items for reuse"""
+        for index in list(self._slots):
+            self._release(index)
+        self.count = 0
+        self.get_card_data = None
+    
+    def hide(self):
+        """Hide every drawn card (e.g. while another view is shown)"""
+        self._set_hover(None)
+        for index in list(self._slots):
+            self._release(index)
+    
+    def destroy(self):
+        self.canvas.delete(self.tag)
+        self._slots = {}
+        self._free = []
+        self._hover = None
+    
+    # ========================================================================
+    # SCROLLABLEFRAME CANVAS CONTENT INTERFACE
+    # ========================================================================
+    def layout(self, top: int, width: int) -> int:
+        """Place the list below top, width pixels wide; return its height"""
+        name_height = self.name_font.metrics("linespace")
+        row_height = 2 * Theme.CARD_PADDING_Y + 4 + name_height + self.desc_font.metrics("linespace")
+        if (top, width, row_height) != (self._top, self._width, self._row_height):
+            self._top, self._width, self._row_height = top, width, row_height
+            self._name_height = name_height
+            for index, slot in self._slots.items():
+                self._place(slot, index)
+        return self.count * (self._row_height + self._row_spacing)
+    
+    def show_viewport(self, view_top: int, view_bottom: int):
+        """Draw the cards between two canvas y coordinates, recycling the rest"""
+        pitch = self._row_height + self._row_spacing
+        if self.count and pitch:
+            first = max(0, (view_top - self._top) // pitch)
+            last = min(self.count - 1, (view_bottom - self._top) // pitch)
+        else:
+            first, last = 0, -1
+        
+        for index in list(self._slots):
+            if index < first or index > last:
+                self._release(index)
+        for index in range(first, last + 1):
+            if index not in self._slots:
+                slot = self._acquire()
+                self._bind(slot, index)
+                self._place(slot, index)
+                self._slots[index] = slot
+    
+    def on_motion(self, x: int, y: int):
+        slot = self._hit(y)
+        self._set_hover(slot)
+        if slot is None:
+            self.canvas.configure(cursor="")
+        elif slot.data.get("busy"):
+            self.canvas.configure(cursor=Theme.BUSY_CURSOR)
+        else:
+            self.canvas.configure(cursor=Theme.BUTTON_CURSOR)
+    
+    def on_leave(self):
+        self._set_hover(None)
+        self.canvas.configure(cursor="")
+    
+    def on_click(self, x: int, y: int):
+        slot = self._hit(y)
+        if slot is not None:
+            slot.data["command"]()
+    
+    # ========================================================================
+    # CARDS
+    # ========================================================================
+    def set_busy(self, key, busy: bool):
+        """Show or clear the in-flight state of the cards showing key"""
+        for slot in self._slots.values():
+            if slot.data.get("key") == key:
+                slot.data["busy"] = busy
+                self.canvas.itemconfigure(
+                    slot.arrow, text=Theme.CARD_BUSY_INDICATOR if busy else Theme.CARD_ARROW)
+    
+    def set_available(self, available_by_key: Dict):
+        """Grey out or restore the drawn cards whose key is in available_by_key"""
+        for slot in self._slots.values():
+            available = available_by_key.get(slot.data.get("key"))
+            if available is not None and available != slot.data.get("available", True):
+                slot.data["available"] = available
+                self._apply_colors(slot)
+    
+    def _hit(self, y: int) -> Optional[_CardSlot]:
+        """Slot of the card under canvas y, if any (the gaps between cards miss)"""
+        offset = y - self._top
+        pitch = self._row_height + self._row_spacing
+        if offset < 0 or not pitch or offset % pitch >= self._row_height:
+            return None
+        return self._slots.get(offset // pitch)
+    
+    def _set_hover(self, slot: Optional[_CardSlot]):
+        if slot is self._hover:
+            return
+        if self._hover is not None:
+            self.canvas.itemconfigure(self._hover.rect, fill=Theme.BG_CARD,
+                                      outline=Theme.BG_CARD_HOVER)
+        if slot is not None:
+            self.canvas.itemconfigure(slot.rect, fill=Theme.BG_CARD_HOVER,
+                                      outline=slot.data["color"])
+        self._hover = slot
+    
+    def _acquire(self) -> _CardSlot:
+        if self._free:
+            slot = self._free.pop()
+            for item in (slot.rect, slot.name, slot.desc, slot.arrow):
+                self.canvas.itemconfigure(item, state="normal")
+            return slot
+        canvas = self.canvas
+        return _CardSlot(
+            canvas.create_rectangle(0, 0, 0, 0, fill=Theme.BG_CARD,
+                                    outline=Theme.BG_CARD_HOVER, tags=self.tag),
+            canvas.create_text(0, 0, anchor="nw", font=self.name_font,
+                               fill=Theme.TEXT_PRIMARY, tags=self.tag),
+            canvas.create_text(0, 0, anchor="nw", font=self.desc_font,
+                               fill=Theme.TEXT_SECONDARY, tags=self.tag),
+            canvas.create_text(0, 0, anchor="e", font=self.ARROW_FONT, tags=self.tag)
+        )
+    
+    def _release(self, index: int):
+        slot = self._slots.pop(index)
+        if slot is self._hover:
+            self._set_hover(None)
+        for item in (slot.rect, slot.name, slot.desc, slot.arrow):
+            self.canvas.itemconfigure(item, state="hidden")
+        slot.index = -1
+        slot.data = None
+        self._free.append(slot)
+    
+    def _bind(self, slot: _CardSlot, index: int):
+        data = self.get_card_data(index)
+        slot.index = index
+        slot.data = data
+        canvas = self.canvas
+        canvas.itemconfigure(slot.rect, fill=Theme.BG_CARD, outline=Theme.BG_CARD_HOVER)
+        canvas.itemconfigure(slot.name, text=data["name"])
+        canvas.itemconfigure(slot.desc, text=data["description"])
+        canvas.itemconfigure(slot.arrow,
+                             text=Theme.CARD_BUSY_INDICATOR if data.get("busy") else Theme.CARD_ARROW)
+        self._apply_colors(slot)
+    
+    def _apply_colors(self, slot: _CardSlot):
+        """Text colors of a card, greyed out if its command is not available"""
+        data = slot.data
+        available = data.get("available", True)
+        canvas = self.canvas
+        canvas.itemconfigure(slot.name, fill=Theme.TEXT_PRIMARY if available else Theme.TEXT_DISABLED)
+        canvas.itemconfigure(slot.desc, fill=Theme.TEXT_SECONDARY if available else Theme.TEXT_DISABLED)
+        canvas.itemconfigure(slot.arrow, fill=data["color"] if available else Theme.TEXT_DISABLED)
+    
+    def _place(self, slot: _CardSlot, index: int):
+        top = self._top + index * (self._row_height + self._row_spacing)
+        left = Theme.CARD_PADDING_X + 1
+        canvas = self.canvas
+        canvas.coords(slot.rect, 0, top, self._width - 1, top + self._row_height - 1)
+        canvas.coords(slot.name, left, top + Theme.CARD_PADDING_Y + 1)
+        canvas.coords(slot.desc, left,
+                      top + Theme.CARD_PADDING_Y + 3 + self._name_height)
+        canvas.coords(slot.arrow, self._width - Theme.CARD_PADDING_X - 1,
+                      top + self._row_height // 2)
@@ -0,0 +1,59 @@
+import tkinter as tk
+from typing import Callable, List, Optional
+from ui.setting_card import SettingCard
+
+
+class CardPool:
+    """Recycles SettingCard instances instead of destroying and rebuilding them
+    
+    Cards handed out by acquire() stay children of the same parent. Releasing
+    them only unpacks them, so the next view rebinds existing widgets to new
+    data rather than paying for six new widgets and their bindings per card.
+    """
+    
+    def __init__(self, parent, on_create: Optional[Callable[[SettingCard], None]] = None):
+        self.parent = parent
+        self.on_create = on_create
+        self.in_use: List[SettingCard] = []
+        self.free: List[SettingCard] = []
+        self._members = set()
+    
+    def acquire(self, name: str, description: str,
+                command: Callable, color: str, key=None, busy: bool = False,
+                available: bool = True) -> SettingCard:
+        """Get a card showing the given data, reusing a free one if possible"""
+        if self.free:
+            card = self.free.pop()
+            card.update_content(name, description, command, color, key, busy, available)
+        else:
+            card = SettingCard(
+                self.parent,
+                name=name,
+                description=description,
+                command=command,
+                color=color,
+                key=key,
+                busy=busy,
+                available=available
+            )
+            self._members.add(card)
+            if self.on_create:
+                self.on_create(card)
+        
+        self.in_use.append(card)
+        return card
+    
+    def release_all(self):
+        """Hide every card in use and return it to the pool"""
+        for card in self.in_use:
+            card.pack_forget()
+        # Reversed so the next acquire() pops the top-most card first
+        self.free.extend(reversed(self.in_use))
+        self.in_use = []
+    
+    def owns(self, widget: tk.Misc) -> bool:
+        """Check whether a widget is a card managed by this pool"""
+        return widget in self._members
+    
+    def __len__(self) -> int:
+        return len(self._members)
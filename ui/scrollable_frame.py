@@ -1,10 +1,34 @@
+import bisect
 import tkinter as tk
 from tkinter import ttk
+from typing import Callable, List, Optional, Sequence, Union
 from theme import Theme
 
 
 class ScrollableFrame(tk.Frame):
-    """Frame with scrollbar support"""
+    """Frame with scrollbar support
+    
+    Besides the regular inner frame, the canvas can show a virtualized list
+    of rows (see set_virtual_rows). Only the rows intersecting the viewport,
+    plus a few rows of overscan, exist as widgets; they are recycled and
+    rebound to other indexes as the user scrolls. Alternatively, content
+    drawn directly on the canvas can be placed below the inner frame (see
+    set_canvas_content).
+    
+    Inner-frame and canvas <Configure> events only record the new size; the
+    scroll region and widths are updated at most once per idle cycle (or
+    RESIZE_THROTTLE_MS while the window is being resized), however many
+    cards were packed in between. A scroll position set with scroll_to() is
+    applied by that same update, right after the new scroll region is set.
+    """
+    
+    RESIZE_THROTTLE_MS = 30
+    
+    # Mouse wheel: units per notch, growing while notches follow each other
+    # within WHEEL_ACCEL_WINDOW_MS, up to WHEEL_MAX_UNITS
+    WHEEL_UNITS = 1
+    WHEEL_ACCEL_WINDOW_MS = 60
+    WHEEL_MAX_UNITS = 6
     
     def __init__(self, parent, **kwargs):
         super().__init__(parent, bg=Theme.BG_DARK, **kwargs)
@@ -24,7 +48,7 @@ class ScrollableFrame(tk.Frame):
         # Create the scrollable frame
         self.scrollable_frame = tk.Frame(self.canvas, bg=Theme.BG_DARK)
         
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.configure(yscrollcommand=self._on_yview)
         
         # Pack scrollbar and canvas
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -37,22 +61,337 @@ class ScrollableFrame(tk.Frame):
             anchor="nw"
         )
         
+        # Virtual list state
+        self._virtual = False
+        self._virtual_count = 0
+        self._create_row: Optional[Callable[[tk.Widget], tk.Widget]] = None
+        self._bind_row: Optional[Callable[[tk.Widget, int], None]] = None
+        self._row_height = 0            # Uniform row height (0 = not measured yet)
+        self._row_offsets: Optional[List[int]] = None  # Prefix sums for varying heights
+        self._measure_rows = False
+        self._row_spacing = 0
+        self._top = 0                   # Height of the regular content above the rows
+        self._visible_rows = {}         # index -> (row, canvas item)
+        self._free_rows = []            # (row, canvas item) ready for reuse
+        self._scrollregion = None
+        
+        # Canvas-drawn content below the inner frame
+        self._canvas_content = None
+        
+        # Coalesced layout updates
+        self._frame_height = 0
+        self._item_width = 0
+        self._layout_id = None
+        self._pending_scroll: Optional[float] = None
+        
+        # Mouse wheel acceleration
+        self._wheel_time = 0
+        self._wheel_units = 0
+        
         # Configure scrolling
         self.scrollable_frame.bind("<Configure>", self._configure_scroll)
         self.canvas.bind("<Configure>", self._configure_canvas)
         
-        # Mouse wheel scrolling
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # Mouse wheel scrolling, only while the pointer is over this frame
+        # (Button-4/5 are the wheel on X11)
+        self.bind_all("<MouseWheel>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-4>", self._on_mousewheel, add="+")
+        self.bind_all("<Button-5>", self._on_mousewheel, add="+")
+        
+        # Pointer events on the canvas itself go to the canvas content
+        self.canvas.bind("<Motion>", self._on_canvas_motion)
+        self.canvas.bind("<Leave>", self._on_canvas_leave)
+        self.canvas.bind("<Button-1>", self._on_canvas_click)
     
     def _configure_scroll(self, event):
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self._frame_height = event.height
+        self._schedule_layout()
     
     def _configure_canvas(self, event):
-        self.canvas.itemconfig(self.canvas_frame, width=event.width)
+        # The first size is applied right away, later resizes are throttled
+        self._schedule_layout(self.RESIZE_THROTTLE_MS if self._item_width else 0)
+    
+    def _schedule_layout(self, delay_ms: int = 0):
+        """Update the layout once pending geometry changes have settled"""
+        if self._layout_id is not None:
+            return
+        if delay_ms:
+            self._layout_id = self.after(delay_ms, self._update_layout)
+        else:
+            self._layout_id = self.after_idle(self._update_layout)
+    
+    def scroll_to(self, fraction: float):
+        """Scroll to fraction (0.0 = top) once the current content is laid out"""
+        self._pending_scroll = fraction
+        self._schedule_layout()
+    
+    def get_scroll_position(self) -> float:
+        """Scroll position (0.0 = top), including one not applied yet"""
+        if self._pending_scroll is not None:
+            return self._pending_scroll
+        return self.canvas.yview()[0]
+    
+    def _update_layout(self):
+        self._layout_id = None
+        scroll = self._pending_scroll
+        if scroll is not None:
+            # The new content's <Configure> may not have arrived yet: settle
+            # its geometry and take its size directly
+            self._pending_scroll = None
+            self.scrollable_frame.update_idletasks()
+            self._frame_height = self.scrollable_frame.winfo_reqheight()
+        
+        width = self.canvas.winfo_width()
+        if width != self._item_width:
+            self._item_width = width
+            self.canvas.itemconfig(self.canvas_frame, width=width)
+            for row, item in self._visible_rows.values():
+                self.canvas.itemconfig(item, width=width)
+        
+        if self._virtual:
+            self._top = self._frame_height
+            self._update_virtual_rows()
+        elif self._canvas_content is not None:
+            self._top = self._frame_height
+            self._update_canvas_content()
+        else:
+            scrollregion = (0, 0, width, self._frame_height)
+            if scrollregion != self._scrollregion:
+                self._scrollregion = scrollregion
+                self.canvas.configure(scrollregion=scrollregion)
+        
+        if scroll is not None:
+            self.canvas.yview_moveto(scroll)
     
     def _on_mousewheel(self, event):
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Scoped: ignore the wheel over other parts of the window
+        widget, own = str(event.widget), str(self)
+        if widget != own and not widget.startswith(own + "."):
+            return
+        if event.num == 4 or event.delta > 0:
+            direction = -1
+        elif event.num == 5 or event.delta < 0:
+            direction = 1
+        else:
+            return
+        notches = max(1, abs(event.delta) // 120)
+        
+        # Accelerate while the wheel keeps spinning
+        if event.time - self._wheel_time < self.WHEEL_ACCEL_WINDOW_MS:
+            self._wheel_units = min(self.WHEEL_MAX_UNITS, self._wheel_units + 1)
+        else:
+            self._wheel_units = self.WHEEL_UNITS
+        self._wheel_time = event.time
+        
+        self.canvas.yview_scroll(direction * notches * self._wheel_units, "units")
+    
+    def _on_yview(self, first, last):
+        self.scrollbar.set(first, last)
+        if self._virtual:
+            self._update_virtual_rows()
+        elif self._canvas_content is not None:
+            self._show_canvas_viewport()
     
     def get_frame(self) -> tk.Frame:
         """Get the inner scrollable frame"""
         return self.scrollable_frame
+    
+    # ========================================================================
+    # CANVAS CONTENT
+    # ========================================================================
+    def set_canvas_content(self, content):
+        """Show content drawn on the canvas below the inner frame
+        
+        content provides layout(top, width) -> height, which places it below
+        canvas y top and returns its height, show_viewport(top, bottom) to draw
+        the part between two canvas y coordinates, hide(), and the pointer
+        handlers on_motion(x, y), on_leave() and on_click(x, y).
+        """
+        self.clear_virtual_rows()
+        self.clear_canvas_content()
+        self._canvas_content = content
+        self._top = self.scrollable_frame.winfo_reqheight()
+        self._update_canvas_content()
+    
+    def clear_canvas_content(self):
+        """Hide the canvas content and go back to the inner frame only"""
+        if self._canvas_content is None:
+            return
+        self._canvas_content.hide()
+        self._canvas_content = None
+        self.canvas.configure(cursor="")
+        self._reset_scrollregion()
+    
+    def _reset_scrollregion(self):
+        """Scroll region of the inner frame alone"""
+        self._scrollregion = None
+        self.canvas.configure(scrollregion=self.canvas.bbox(self.canvas_frame))
+    
+    def refresh_canvas_content(self):
+        """Re-lay out the canvas content (e.g. after its fonts changed)"""
+        if self._canvas_content is not None:
+            self._update_canvas_content()
+    
+    def _update_canvas_content(self):
+        width = self.canvas.winfo_width()
+        height = self._canvas_content.layout(self._top, width)
+        scrollregion = (0, 0, width, self._top + height)
+        if scrollregion != self._scrollregion:
+            self._scrollregion = scrollregion
+            self.canvas.configure(scrollregion=scrollregion)
+        self._show_canvas_viewport()
+    
+    def _show_canvas_viewport(self):
+        top = int(self.canvas.canvasy(0))
+        self._canvas_content.show_viewport(top, top + self.canvas.winfo_height())
+    
+    def _on_canvas_motion(self, event):
+        if self._canvas_content is not None:
+            self._canvas_content.on_motion(int(self.canvas.canvasx(event.x)),
+                                           int(self.canvas.canvasy(event.y)))
+    
+    def _on_canvas_leave(self, event):
+        if self._canvas_content is not None:
+            self._canvas_content.on_leave()
+    
+    def _on_canvas_click(self, event):
+        if self._canvas_content is not None:
+            self._canvas_content.on_click(int(self.canvas.canvasx(event.x)),
+                                          int(self.canvas.canvasy(event.y)))
+    
+    # ========================================================================
+    # VIRTUAL LIST MODE
+    # ========================================================================
+    def set_virtual_rows(self, count: int,
+                         create_row: Callable[[tk.Widget], tk.Widget],
+                         bind_row: Callable[[tk.Widget, int], None],
+                         row_height: Union[int, Sequence[int], None] = None,
+                         row_spacing: int = 0):
+        """Show count rows below the inner frame, materializing only visible ones
+        
+        create_row(parent) builds a new, unbound row widget; bind_row(row, index)
+        makes an existing row display the given index. row_height is either a
+        uniform height, a per-row sequence of heights, or None to measure the
+        first row and assume all rows are that tall.
+        """
+        self.clear_virtual_rows()
+        self.clear_canvas_content()
+        
+        self._virtual = True
+        self._virtual_count = count
+        self._create_row = create_row
+        self._bind_row = bind_row
+        self._row_spacing = row_spacing
+        self._top = self.scrollable_frame.winfo_reqheight()
+        
+        self._measure_rows = row_height is None
+        self._row_offsets = None
+        self._row_height = 0
+        if isinstance(row_height, int):
+            self._row_height = row_height
+        elif row_height is not None:
+            offsets = [0]
+            for height in row_height:
+                offsets.append(offsets[-1] + height + row_spacing)
+            self._row_offsets = offsets
+        
+        self.canvas.yview_moveto(0)
+        self._update_virtual_rows()
+    
+    def clear_virtual_rows(self):
+        """Leave virtual list mode, keeping the row widgets for reuse"""
+        if not self._virtual:
+            return
+        for index in list(self._visible_rows):
+            self._release_row(index)
+        self._virtual = False
+        self._virtual_count = 0
+        self._bind_row = None
+        self._reset_scrollregion()
+    
+    def get_virtual_rows(self) -> List[tk.Widget]:
+        """Get the row widgets currently materialized in virtual list mode"""
+        return [row for row, item in self._visible_rows.values()]
+    
+    def _row_top(self, index: int) -> int:
+        if self._row_offsets is not None:
+            return self._row_offsets[index]
+        return index * (self._row_height + self._row_spacing)
+    
+    def _row_at(self, y: int) -> int:
+        """Index of the row covering content y (relative to the first row)"""
+        if self._row_offsets is not None:
+            return bisect.bisect_right(self._row_offsets, y) - 1
+        return y // (self._row_height + self._row_spacing)
+    
+    def _content_height(self) -> int:
+        if self._row_offsets is not None:
+            return self._row_offsets[-1]
+        return self._virtual_count * (self._row_height + self._row_spacing)
+    
+    def _update_virtual_rows(self):
+        """Recycle rows that scrolled out of view and bind the newly visible ones"""
+        count = self._virtual_count
+        width = self.canvas.winfo_width()
+        
+        if count and self._measure_rows and not self._row_height:
+            self._measure_row_height()
+        
+        # Only touch the scrollregion when it changes - reconfiguring it
+        # reschedules the yscrollcommand that called us
+        scrollregion = (0, 0, width, self._top + self._content_height())
+        if scrollregion != self._scrollregion:
+            self._scrollregion = scrollregion
+            self.canvas.configure(scrollregion=scrollregion)
+        
+        if count:
+            view_top = int(self.canvas.canvasy(0)) - self._top
+            view_bottom = view_top + self.canvas.winfo_height()
+            overscan = Theme.VIRTUAL_OVERSCAN_ROWS
+            first = max(0, self._row_at(max(0, view_top)) - overscan)
+            last = min(count - 1, self._row_at(max(0, view_bottom)) + overscan)
+        else:
+            first, last = 0, -1
+        
+        for index in list(self._visible_rows):
+            if index < first or index > last:
+                self._release_row(index)
+        
+        for index in range(first, last + 1):
+            if index in self._visible_rows:
+                continue
+            row, item = self._acquire_row()
+            self._bind_row(row, index)
+            self.canvas.coords(item, 0, self._top + self._row_top(index))
+            self.canvas.itemconfig(item, state="normal", width=width)
+            self._visible_rows[index] = (row, item)
+    
+    def _acquire_row(self):
+        if self._free_rows:
+            return self._free_rows.pop()
+        row = self._create_row(self.canvas)
+        item = self.canvas.create_window(0, 0, window=row, anchor="nw", state="hidden")
+        row.bind("<Configure>", self._on_row_configure, add="+")
+        return row, item
+    
+    def _release_row(self, index: int):
+        row, item = self._visible_rows.pop(index)
+        self.canvas.itemconfig(item, state="hidden")
+        self._free_rows.append((row, item))
+    
+    def _measure_row_height(self):
+        """Measure the uniform row height from a materialized row"""
+        row, item = self._acquire_row()
+        self._bind_row(row, 0)
+        row.update_idletasks()
+        self._row_height = row.winfo_reqheight()
+        self._free_rows.append((row, item))
+    
+    def _on_row_configure(self, event):
+        # A measured row changed height (e.g. after zooming): re-lay out
+        if (self._virtual and self._measure_rows and self._row_height
+                and event.height != self._row_height):
+            self._row_height = event.height
+            for index, (row, item) in self._visible_rows.items():
+                self.canvas.coords(item, 0, self._top + self._row_top(index))
+            self._update_virtual_rows()
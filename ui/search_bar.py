@@ -1,14 +1,25 @@
 import tkinter as tk
-from typing import Callable
+from typing import Callable, Optional
 from theme import Theme
 
 
 class SearchBar(tk.Frame):
-    """Search bar widget"""
+    """Search bar widget with a debounced, cancellable search pipeline
     
-    def __init__(self, parent, on_search: Callable, **kwargs):
+    Every keystroke starts a new search generation and cancels the pending
+    one. The search callback only runs once typing has been quiet for
+    debounce_ms, and only if no newer keystroke arrived in the meantime.
+    """
+    
+    def __init__(self, parent, on_search: Callable,
+                 debounce_ms: Optional[int] = None, **kwargs):
         super().__init__(parent, bg=Theme.BG_DARKER, **kwargs)
         
+        self.on_search = on_search
+        self.debounce_ms = Theme.SEARCH_DEBOUNCE_MS if debounce_ms is None else debounce_ms
+        self.generation = 0
+        self._pending = None
+        
         tk.Label(
             self,
             text="🔍",
@@ -17,7 +28,7 @@ class SearchBar(tk.Frame):
         ).pack(side=tk.LEFT, padx=(0, 5))
         
         self.search_var = tk.StringVar()
-        self.search_var.trace_add('write', lambda *args: on_search(self.search_var.get()))
+        self.search_var.trace_add('write', lambda *args: self._schedule())
         
         self.entry = tk.Entry(
             self,
@@ -30,6 +41,41 @@ class SearchBar(tk.Frame):
             relief=tk.FLAT,
             bd=0
         )
-        self.entry.pack(pady=Theme.SEARCH_BAR_PADDING_Y, 
-                       ipady=Theme.SEARCH_BAR_PADDING_Y, 
+        self.entry.pack(pady=Theme.SEARCH_BAR_PADDING_Y,
+                       ipady=Theme.SEARCH_BAR_PADDING_Y,
                        padx=Theme.SEARCH_BAR_PADDING_X)
+        
+        # Enter skips the debounce window
+        self.entry.bind("<Return>", lambda e: self.flush())
+    
+    def _schedule(self):
+        """Start a new search generation, superseding any pending one"""
+        self.cancel()
+        self.generation += 1
+        if self.debounce_ms <= 0:
+            self._run(self.generation)
+        else:
+            self._pending = self.after(self.debounce_ms, self._run, self.generation)
+    
+    def _run(self, generation: int):
+        """Run the search for a generation unless it has gone stale"""
+        self._pending = None
+        if not self.is_current(generation):
+            return
+        self.on_search(self.search_var.get())
+    
+    def is_current(self, generation: int) -> bool:
+        """Check whether a generation is still the latest query"""
+        return generation == self.generation
+    
+    def cancel(self):
+        """Cancel the pending search, if any"""
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+    
+    def flush(self):
+        """Run the pending search immediately"""
+        if self._pending is not None:
+            self.cancel()
+            self._run(self.generation)
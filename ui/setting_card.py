@@ -7,7 +7,8 @@ class SettingCard(tk.Frame):
     """Card widget for displaying individual settings - click anywhere to open"""
     
     def __init__(self, parent, name: str, description: str, 
-                 command: Callable, color: str, **kwargs):
+                 command: Callable, color: str, key=None, busy: bool = False,
+                 available: bool = True, **kwargs):
         super().__init__(
             parent,
             bg=Theme.BG_CARD,
@@ -21,6 +22,9 @@ class SettingCard(tk.Frame):
         
         self.color = color
         self.command = command
+        self.key = key
+        self.busy = False
+        self.available = available
         
         # Content container
         content = tk.Frame(self, bg=Theme.BG_CARD, cursor=Theme.BUTTON_CURSOR)
@@ -55,24 +59,71 @@ class SettingCard(tk.Frame):
         self.desc_label.pack(anchor="w", pady=(2, 0))
         
         # Arrow indicator on the right
-        arrow_label = tk.Label(
+        self.arrow_label = tk.Label(
             content,
-            text="→",
+            text=Theme.CARD_ARROW,
             font=("Segoe UI", 16),
             bg=Theme.BG_CARD,
             fg=color,
             cursor=Theme.BUTTON_CURSOR
         )
-        arrow_label.pack(side=tk.RIGHT, padx=(10, 0))
+        self.arrow_label.pack(side=tk.RIGHT, padx=(10, 0))
         
         # Store all widgets for hover effects and clicks
-        self.widgets = [self, content, info_frame, self.name_label, self.desc_label, arrow_label]
+        self.widgets = [self, content, info_frame, self.name_label, self.desc_label, self.arrow_label]
         
         # Bind hover effects and clicks to all widgets
         for widget in self.widgets:
             widget.bind("<Enter>", self._on_enter)
             widget.bind("<Leave>", self._on_leave)
             widget.bind("<Button-1>", self._on_click)
+        
+        if busy:
+            self.set_busy(True)
+        if not available:
+            self._apply_text_colors()
+    
+    def update_content(self, name: str, description: str,
+                       command: Callable, color: str, key=None, busy: bool = False,
+                       available: bool = True):
+        """Rebind a recycled card to a different setting"""
+        self.color = color
+        self.command = command
+        self.key = key
+        self.available = available
+        self.name_label.configure(text=name)
+        self.desc_label.configure(text=description)
+        self._apply_text_colors()
+        self.set_busy(busy)
+        self._on_leave(None)
+    
+    def _apply_text_colors(self):
+        """Grey out a card whose command is not available on this host"""
+        if self.available:
+            self.name_label.configure(fg=Theme.TEXT_PRIMARY)
+            self.desc_label.configure(fg=Theme.TEXT_SECONDARY)
+            self.arrow_label.configure(fg=self.color)
+        else:
+            self.name_label.configure(fg=Theme.TEXT_DISABLED)
+            self.desc_label.configure(fg=Theme.TEXT_DISABLED)
+            self.arrow_label.configure(fg=Theme.TEXT_DISABLED)
+    
+    def set_available(self, available: bool):
+        """Grey out or restore the card after its command's availability changed"""
+        if available == self.available:
+            return
+        self.available = available
+        self._apply_text_colors()
+    
+    def set_busy(self, busy: bool):
+        """Show or clear the in-flight state while the command launches"""
+        if busy == self.busy:
+            return
+        self.busy = busy
+        self.arrow_label.configure(text=Theme.CARD_BUSY_INDICATOR if busy else Theme.CARD_ARROW)
+        cursor = Theme.BUSY_CURSOR if busy else Theme.BUTTON_CURSOR
+        for widget in self.widgets:
+            widget.configure(cursor=cursor)
     
     def _on_click(self, event):
         """Handle click event"""
@@ -22,9 +22,13 @@ class SidebarButton(tk.Button):
             pady=Theme.SIDEBAR_BUTTON_INTERNAL_PADDING_Y,
             cursor=Theme.BUTTON_CURSOR,
             bd=0,
+            justify=tk.LEFT,
             **kwargs
         )
         
+        self.label = text
+        self.badge = None
+        
         self.bind("<Enter>", self._on_enter)
         self.bind("<Leave>", self._on_leave)
     
@@ -36,6 +40,14 @@ class SidebarButton(tk.Button):
         if not hasattr(self, 'is_active') or not self.is_active:
             self.configure(bg=Theme.SIDEBAR_ACTIVE)
     
+    def set_badge(self, badge: str):
+        """Show a live status line below the label (empty to remove it)"""
+        badge = badge or None
+        if badge == self.badge:
+            return
+        self.badge = badge
+        self.configure(text=f"{self.label}\n{badge}" if badge else self.label)
+    
     def set_active(self, active: bool):
         self.is_active = active
         self.configure(bg=Theme.SIDEBAR_HOVER if active else Theme.SIDEBAR_ACTIVE)
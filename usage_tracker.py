@@ -0,0 +1,124 @@
+# ============================================================================
+# FILE: usage_tracker.py
+# ============================================================================
+
+import heapq
+import json
+import math
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app_paths import get_data_dir, write_atomic
+
+
+class UsageTracker:
+    """Tracks how often and how recently settings are launched (frecency)
+    
+    Each setting keeps a score that decays exponentially with HALF_LIFE_DAYS
+    and gains 1 per launch. Score and timestamp are stored together, so
+    recording a launch is O(1): the old score is decayed to now and
+    incremented. Launches are recorded in memory only; they are flushed to
+    disk in batches, FLUSH_DELAY_MS after the first unsaved launch.
+    """
+    
+    HALF_LIFE_DAYS = 7
+    FLUSH_DELAY_MS = 30000
+    FILE_NAME = "usage.json"
+    VERSION = 1
+    
+    # Search ranking bonus: SEARCH_BOOST_SCALE * log(1 + frecency), capped
+    SEARCH_BOOST_SCALE = 8.0
+    SEARCH_BOOST_MAX = 25.0
+    
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or os.path.join(get_data_dir(), self.FILE_NAME)
+        self.entries: Dict[str, Tuple[float, float]] = {}  # key -> (score, timestamp)
+        self.root = None
+        self._dirty = False
+        self._flush_id = None
+        self._decay_rate = math.log(2) / (self.HALF_LIFE_DAYS * 86400)
+    
+    @staticmethod
+    def make_key(module_name: str, setting_name: str) -> str:
+        """Key of a setting that stays the same across sessions"""
+        return f"{module_name}/{setting_name}"
+    
+    def load(self) -> "UsageTracker":
+        """Read saved usage; a missing or unreadable file starts empty
+        
+        Entries that are not a (score, timestamp) pair of numbers are skipped.
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if isinstance(data, dict) and data.get("version") == self.VERSION:
+            entries = data.get("entries")
+            if isinstance(entries, dict):
+                self.entries = {key: (float(entry[0]), float(entry[1]))
+                                for key, entry in entries.items() if self._is_entry(entry)}
+        return self
+    
+    @staticmethod
+    def _is_entry(entry) -> bool:
+        """Whether a saved entry is a (score, timestamp) pair of finite numbers"""
+        return (isinstance(entry, list) and len(entry) == 2 and
+                all(isinstance(value, (int, float)) and not isinstance(value, bool)
+                    and math.isfinite(value) for value in entry))
+    
+    def attach(self, root):
+        """Use root.after to schedule the batched flushes"""
+        self.root = root
+    
+    def record(self, module_name: str, setting_name: str, now: Optional[float] = None):
+        """Record a launch (in memory; the flush is scheduled, not performed)"""
+        now = time.time() if now is None else now
+        key = self.make_key(module_name, setting_name)
+        self.entries[key] = (self._decayed(key, now) + 1.0, now)
+        self._dirty = True
+        if self._flush_id is None and self.root is not None:
+            self._flush_id = self.root.after(self.FLUSH_DELAY_MS, self.flush)
+    
+    def frecency(self, module_name: str, setting_name: str, now: Optional[float] = None) -> float:
+        """Current frecency score of a setting (0.0 if never launched)"""
+        now = time.time() if now is None else now
+        return self._decayed(self.make_key(module_name, setting_name), now)
+    
+    def _decayed(self, key: str, now: float) -> float:
+        entry = self.entries.get(key)
+        if entry is None:
+            return 0.0
+        score, stamp = entry
+        return score * math.exp(-self._decay_rate * max(0.0, now - stamp))
+    
+    def top(self, count: int, now: Optional[float] = None) -> List[Tuple[str, str]]:
+        """(module name, setting name) of the count highest-scoring settings"""
+        now = time.time() if now is None else now
+        best = heapq.nlargest(count, self.entries, key=lambda key: self._decayed(key, now))
+        return [tuple(key.split("/", 1)) for key in best]
+    
+    def search_boost(self, module_name: str, setting_name: str) -> float:
+        """Ranking bonus for a search result"""
+        score = self.frecency(module_name, setting_name)
+        if not score:
+            return 0.0
+        return min(self.SEARCH_BOOST_MAX, self.SEARCH_BOOST_SCALE * math.log1p(score))
+    
+    def flush(self):
+        """Write unsaved launches now (atomically)"""
+        if self._flush_id is not None:
+            self.root.after_cancel(self._flush_id)
+            self._flush_id = None
+        if not self._dirty:
+            return
+        
+        data = {"version": self.VERSION, "entries": self.entries}
+        try:
+            write_atomic(self.path, lambda f: json.dump(data, f))
+        except OSError as e:
+            # Still dirty: the next flush tries again
+            print(f"Could not save usage data to {self.path}: {e}")
+            return
+        self._dirty = False
@@ -3,15 +3,32 @@
 # ============================================================================
 
 import tkinter as tk
+import tkinter.font as tkfont
 from theme import Theme
 
 
 class ZoomManager:
-    """Manages font zoom/scaling for the entire application"""
+    """Manages font zoom/scaling for the entire application
+    
+    Every font style (a Theme.FONT_* tuple) is backed by one shared named
+    font. Registered widgets use that font object, so a zoom step only
+    reconfigures one font per style and Tk updates the widgets itself.
+    """
     
     def __init__(self, root: tk.Tk):
         self.root = root
-        self.widgets_to_update = []
+        self.listeners = []
+        
+        # Registered widgets (path name -> base font). Entries are removed by
+        # the widget's <Destroy> event, so the size tracks live widgets only
+        self.registered_widgets = {}
+        self.registry_high_water_mark = 0
+        
+        # Shared named fonts, keyed by their unscaled base font tuple
+        self.fonts = {}
+        for name, value in vars(Theme).items():
+            if name.startswith("FONT_") and isinstance(value, tuple):
+                self.get_font(value)
         
         # Bind Ctrl+MouseWheel globally
         self.root.bind_all("<Control-MouseWheel>", self._on_zoom)
@@ -21,15 +38,49 @@ class ZoomManager:
         self.root.bind_all("<Control-minus>", lambda e: self._zoom_out())
         self.root.bind_all("<Control-Key-0>", lambda e: self._reset_zoom())
     
+    def get_font(self, base_font: tuple) -> tkfont.Font:
+        """Get the shared, zoom-scaled font for a base font tuple"""
+        font = self.fonts.get(base_font)
+        if font is None:
+            scaled = Theme.scale_font(base_font)
+            font = tkfont.Font(
+                root=self.root,
+                family=scaled[0],
+                size=scaled[1],
+                weight=tkfont.BOLD if "bold" in scaled[2:] else tkfont.NORMAL
+            )
+            self.fonts[base_font] = font
+        return font
+    
     def register_widget(self, widget, base_font: tuple):
         """Register a widget to be updated when zoom changes"""
-        self.widgets_to_update.append((widget, base_font))
+        widget.configure(font=self.get_font(base_font))
+        
+        key = str(widget)
+        if key not in self.registered_widgets:
+            widget.bind("<Destroy>", self._on_widget_destroyed, add="+")
+        self.registered_widgets[key] = base_font
+        self.registry_high_water_mark = max(self.registry_high_water_mark,
+                                            len(self.registered_widgets))
     
     def register_multiple(self, widget_font_pairs: list):
         """Register multiple widgets at once"""
         for widget, font in widget_font_pairs:
             self.register_widget(widget, font)
     
+    def _on_widget_destroyed(self, event):
+        """Forget a registered widget once Tk destroys it"""
+        self.registered_widgets.pop(str(event.widget), None)
+    
+    @property
+    def registry_size(self) -> int:
+        """Number of live registered widgets"""
+        return len(self.registered_widgets)
+    
+    def add_listener(self, callback):
+        """Call callback() after every zoom level change"""
+        self.listeners.append(callback)
+    
     def _on_zoom(self, event):
         """Handle Ctrl+MouseWheel zoom"""
         if event.delta > 0:
@@ -40,41 +91,28 @@ class ZoomManager:
     def _zoom_in(self):
         """Zoom in"""
         Theme.zoom_in()
-        self._update_all_fonts()
+        self._apply_zoom()
         print(f"Zoom: {int(Theme.get_zoom_level() * 100)}%")
     
     def _zoom_out(self):
         """Zoom out"""
         Theme.zoom_out()
-        self._update_all_fonts()
+        self._apply_zoom()
         print(f"Zoom: {int(Theme.get_zoom_level() * 100)}%")
     
     def _reset_zoom(self):
         """Reset zoom to 100%"""
         Theme.set_zoom_level(1.0)
-        self._update_all_fonts()
+        self._apply_zoom()
         print("Zoom: 100% (reset)")
     
-    def _update_all_fonts(self):
-        """Update fonts for all registered widgets"""
-        for widget, base_font in self.widgets_to_update:
-            try:
-                if widget.winfo_exists():
-                    scaled_font = Theme.scale_font(base_font)
-                    widget.configure(font=scaled_font)
-            except tk.TclError:
-                # Widget no longer exists
-                pass
-        
-        # Clean up dead widgets
-        self.widgets_to_update = [
-            (w, f) for w, f in self.widgets_to_update 
-            if self._widget_exists(w)
-        ]
+    def _apply_zoom(self):
+        """Apply the current zoom level and notify listeners"""
+        self._update_all_fonts()
+        for callback in self.listeners:
+            callback()
     
-    def _widget_exists(self, widget):
-        """Check if widget still exists"""
-        try:
-            return widget.winfo_exists()
-        except tk.TclError:
-            return False
+    def _update_all_fonts(self):
+        """Rescale the shared fonts - Tk redraws the widgets using them"""
+        for base_font, font in self.fonts.items():
+            font.configure(size=Theme.scale_font(base_font)[1])